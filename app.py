@@ -4,9 +4,9 @@ Art Backend API - Main application entry point.
 
 import logging
 from litestar import Litestar, Router, get, Response
-from litestar.config.cors import CORSConfig
-from litestar.logging import LoggingConfig
+from litestar.enums import MediaType
 from litestar.status_codes import HTTP_200_OK
+from litestar.datastructures import State
 from litestar.di import Provide
 from serializer.asyncpg import serialize_asyncpg_record
 import asyncpg
@@ -29,36 +29,35 @@ from controllers.user_artworks import (
 )
 from controllers.popular_artworks import get_popular_artworks
 from middleware.auth import create_auth
-from dependencies import get_ai_service, get_settings, authenticated_user_provider
+from dependencies import (
+    create_ai_service,
+    get_ai_service,
+    get_settings,
+    authenticated_user_provider,
+)
 from dependencies.repository_provider import (
+    create_artwork_repository,
     get_artwork_repository,
     initialize_database,
     shutdown_database,
 )
-from dependencies.storage_provider import artwork_storage_provider
-from dependencies.url_resolver_provider import url_resolver_provider
-from config.settings import Settings
-
-# Configure logging with Litestar's LoggingConfig
-logging_config = LoggingConfig(
-    root={"level": logging.getLevelName(logging.INFO), "handlers": ["console"]},
-    formatters={
-        "standard": {
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        }
-    },
-    loggers={
-        "app": {"level": "INFO", "handlers": ["console"], "propagate": False},
-        "litestar": {"level": "INFO", "handlers": ["console"], "propagate": False},
-    },
+from dependencies.storage_provider import (
+    artwork_storage_provider,
+    create_artwork_storage_service,
 )
+from dependencies.url_resolver_provider import url_resolver_provider
+from config.litestar_config import CORS_CONFIG, LOGGING_CONFIG
+from config.settings import get_cached_settings
+from utils.ai_limiter import ConcurrencyLimitedAIService
 
 logger = logging.getLogger(__name__)
 
+# Settings are immutable after startup, load them once and share via app state
+settings = get_cached_settings()
+
 # Create authentication middleware
 auth = create_auth(
-    token_secret=Settings().SUPABASE_JWT_SECRET,
+    token_secret=settings.SUPABASE_JWT_SECRET,
     default_token_expiration=3600,  # 1 hour
 )
 
@@ -89,34 +88,52 @@ ai_router = Router(
 )
 
 
-# Health check endpoint
-@get("/health", status_code=HTTP_200_OK)
-async def health_check() -> str:
-    """Health check endpoint"""
-    return Response(content="healthy", media_type="text/plain", status_code=HTTP_200_OK)
+# Health check endpoint, the response never changes so it is built once
+_HEALTHY_RESPONSE = Response(
+    content=b"healthy", media_type=MediaType.TEXT, status_code=HTTP_200_OK
+)
 
 
-# Configure CORS
-cors_config = CORSConfig(
-    allow_origins=["*"],  # In production, specify your frontend domain
-    allow_methods=["GET", "POST"],
-    allow_headers=["*"],
-)
+@get("/health", status_code=HTTP_200_OK, sync_to_thread=False)
+def health_check() -> Response:
+    """Health check endpoint"""
+    return _HEALTHY_RESPONSE
 
 
 # Application lifecycle event handlers
-async def startup() -> None:
-    """Initialize database on application startup."""
+async def startup(app: Litestar) -> None:
+    """Initialize database and shared services on application startup."""
+    # The log format does not use thread or process fields, skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger.info("Initializing database...")
-    settings = Settings()
-    await initialize_database(settings)
+    app.state.postgres_pool = await initialize_database(settings)
     logger.info("Database initialized successfully")
 
+    # Stateless services are created once and shared by all requests
+    app.state.repository = create_artwork_repository(settings, app.state.postgres_pool)
+    app.state.storage_service = create_artwork_storage_service(settings)
+
+    # The provider client keeps its HTTP connections, so one AI service is created and
+    # shared, wrapped with concurrency limiting when enabled
+    ai_service = create_ai_service(settings)
+    if settings.AI_MAX_CONCURRENCY > 0:
+        ai_service = ConcurrencyLimitedAIService(
+            ai_service,
+            max_concurrency=settings.AI_MAX_CONCURRENCY,
+            queue_timeout=settings.AI_QUEUE_TIMEOUT,
+        )
+        logger.info("AI concurrency limited to %d calls", settings.AI_MAX_CONCURRENCY)
+
+    app.state.ai_service = ai_service
+
 
-async def shutdown() -> None:
-    """Cleanup database connections on application shutdown."""
+async def shutdown(app: Litestar) -> None:
+    """Cleanup database connections and shared services on application shutdown."""
     logger.info("Shutting down database connections...")
-    await shutdown_database()
+    await shutdown_database(app.state.get("postgres_pool"))
     logger.info("Database connections closed")
 
 
@@ -126,11 +143,12 @@ api_router.register(ai_router)
 # Create Litestar app with routers and exception handlers
 app = Litestar(
     route_handlers=[api_router, health_check],
-    cors_config=cors_config,
-    logging_config=logging_config,
+    cors_config=CORS_CONFIG,
+    logging_config=LOGGING_CONFIG,
     on_app_init=[auth.on_app_init],
     on_startup=[startup],
     on_shutdown=[shutdown],
+    state=State({"settings": settings}),
     type_encoders={asyncpg.Record: serialize_asyncpg_record},
     debug=True,  # Enable debug mode for detailed error logging
 )
@@ -0,0 +1,29 @@
+"""
+Litestar framework configuration shared by the application.
+"""
+
+import logging
+from litestar.config.cors import CORSConfig
+from litestar.logging import LoggingConfig
+
+# Configure logging with Litestar's LoggingConfig
+LOGGING_CONFIG = LoggingConfig(
+    root={"level": logging.getLevelName(logging.INFO), "handlers": ["console"]},
+    formatters={
+        "standard": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        }
+    },
+    loggers={
+        "app": {"level": "INFO", "handlers": ["console"], "propagate": False},
+        "litestar": {"level": "INFO", "handlers": ["console"], "propagate": False},
+    },
+)
+
+# Configure CORS
+CORS_CONFIG = CORSConfig(
+    allow_origins=["*"],  # In production, specify your frontend domain
+    allow_methods=["GET", "POST"],
+    allow_headers=["*"],
+)
@@ -2,20 +2,37 @@
 Controller for artwork subject expansion endpoints.
 """
 
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Optional
 from litestar import Response, post, get
-from litestar.status_codes import HTTP_200_OK, HTTP_404_NOT_FOUND
+from litestar.response import Redirect
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_303_SEE_OTHER,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+)
 from litestar.params import Dependency
+from litestar.serialization import encode_json
 from dataclasses import dataclass
 from services.base import AIService
 from repositories.base import ArtworkRepository
+from utils.url_resolver import url_for
 from litestar import Request
+from utils.cache import LRUCache, SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Encoded expansion responses keyed by expansion ID
+_expansion_responses = LRUCache(maxsize=1024)
 
-@dataclass
+# Concurrent cache misses for the same expansion share one database fetch
+_expansion_fetches = SingleFlight()
+
+
+@dataclass(slots=True)
 class ExpandSubjectRequest:
     """Request data for expanding on a wikilink subject."""
 
@@ -23,6 +40,15 @@ class ExpandSubjectRequest:
     subject: str
     parent_expansion_id: Optional[str] = None
 
+    def __post_init__(self):
+        # Runs while the request body is decoded, Litestar reports these errors as a 400
+        self.subject = self.subject.strip()
+        self.artwork_id = self.artwork_id.strip()
+        if not self.subject:
+            raise ValueError("Subject cannot be empty")
+        if not self.artwork_id:
+            raise ValueError("Artwork ID cannot be empty")
+
 
 @post("/artwork/expand", name="expand_subject")
 async def expand_subject(
@@ -46,37 +72,39 @@ async def expand_subject(
     Returns: Redirect to the created expansion resource
     """
     logger.info(
-        f"Received subject expansion request: subject={data.subject}, "
-        f"artwork_id={data.artwork_id}"
+        "Received subject expansion request: subject=%s, artwork_id=%s",
+        data.subject,
+        data.artwork_id,
     )
 
-    # Validate inputs
-    if not data.subject or not data.subject.strip():
-        raise ValueError("Subject cannot be empty")
-
-    if not data.artwork_id or not data.artwork_id.strip():
-        raise ValueError("Artwork ID cannot be empty")
-
-    # Check if expansion already exists in cache
-    cached_expansion = await repository.get_cached_subject_expansion(
-        artwork_id=data.artwork_id,
-        subject=data.subject,
-        parent_expansion_id=data.parent_expansion_id,
+    # Start fetching the original artwork explanation while the expansion cache is
+    # checked, so a miss doesn't pay for a second round trip. A hit cancels the fetch.
+    explanation_task = asyncio.create_task(
+        repository.get_artwork_explanation_xml(data.artwork_id)
     )
-    
+    try:
+        cached_expansion = await repository.get_cached_subject_expansion(
+            artwork_id=data.artwork_id,
+            subject=data.subject,
+            parent_expansion_id=data.parent_expansion_id,
+        )
+    except BaseException:
+        explanation_task.cancel()
+        raise
+
     if cached_expansion is not None:
-        logger.info(f"Found cached expansion for subject: {data.subject}")
+        explanation_task.cancel()
+        logger.info("Found cached expansion for subject: %s", data.subject)
         expansion_record = cached_expansion
     else:
-        # Retrieve original artwork explanation from database
-        artwork_record = await repository.get_artwork_explanation(data.artwork_id)
-        if artwork_record is None:
+        explanation_xml = await explanation_task
+        if explanation_xml is None:
             raise ValueError(f"Artwork not found: {data.artwork_id}")
 
         # Get expansion from AI for the artwork_id and provided subject
         expansion_xml = await ai_service.expand_subject(
             artwork_id=data.artwork_id,
-            original_artwork_explanation=artwork_record["explanation_xml"],
+            original_artwork_explanation=explanation_xml,
             subject=data.subject,
         )
 
@@ -87,19 +115,19 @@ async def expand_subject(
             expansion_xml=expansion_xml,
             parent_expansion_id=data.parent_expansion_id,
         )
-        logger.info(f"Saved subject expansion to database: {data.subject}")
+        logger.info("Saved subject expansion to database: %s", data.subject)
 
     # Return redirect to the expansion endpoint
-    logger.info(f"Successfully generated subject expansion for: {data.subject}")
-    return Response(
-        content="",
-        status_code=303,
-        headers={"Location": request.url_for("get_expansion", expansion_id=str(expansion_record["expansion_id"]))},
+    logger.info("Successfully generated subject expansion for: %s", data.subject)
+    return Redirect(
+        path=url_for(request, "get_expansion", expansion_id=expansion_record["expansion_id"]),
+        status_code=HTTP_303_SEE_OTHER,
     )
 
 
 @get("/expansion/{expansion_id:str}", name="get_expansion")
 async def get_expansion(
+    request: Request,
     expansion_id: str,
     repository: ArtworkRepository = Dependency(),
 ) -> Response:
@@ -111,22 +139,37 @@ async def get_expansion(
 
     Returns: JSON object with expansion data or 404 if not found
     """
-    logger.info(f"Received expansion retrieval request: expansion_id={expansion_id}")
-
-    # Retrieve subject expansion from database
-    expansion_record = await repository.get_subject_expansion(expansion_id)
-    if expansion_record is None:
-        logger.warning(f"Expansion not found: {expansion_id}")
-        return Response(
-            content="Expansion not found",
-            status_code=HTTP_404_NOT_FOUND,
+    logger.debug("Received expansion retrieval request: expansion_id=%s", expansion_id)
+
+    # Serve the already encoded body when available
+    content = _expansion_responses.get(expansion_id)
+    if content is None:
+        # Retrieve subject expansion from database
+        expansion_record = await _expansion_fetches.do(
+            expansion_id, repository.get_subject_expansion, expansion_id
         )
-
-    logger.info(f"Successfully retrieved subject expansion: {expansion_id}")
+        if expansion_record is None:
+            logger.warning("Expansion not found: %s", expansion_id)
+            return Response(
+                content="Expansion not found",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+
+        content = encode_json(dict(expansion_record))
+        _expansion_responses.set(expansion_id, content)
+
+    # Expansions don't change once saved, so a client holding the ETag already has the body
+    etag = f'"{expansion_id}"'
+    cache_headers = {"Cache-Control": "public, max-age=31536000, immutable", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(content=b"", status_code=HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    logger.debug("Successfully retrieved subject expansion: %s", expansion_id)
     return Response(
-        content=expansion_record,
+        content=content,
         media_type="application/json",
         status_code=HTTP_200_OK,
+        headers=cache_headers,
     )
 
 
@@ -143,39 +186,40 @@ async def get_artwork_expansions(
 
     Returns: JSON array with hierarchical expansion tree or 404 if artwork not found
     """
-    logger.info(f"Received artwork expansions request: artwork_id={artwork_id}")
+    logger.debug("Received artwork expansions request: artwork_id=%s", artwork_id)
 
     # Retrieve all expansions for the artwork using recursive query
     all_expansions = await repository.get_all_expansions_with_hierarchy(artwork_id)
     
     if not all_expansions:
-        logger.warning(f"No expansions found for artwork: {artwork_id}")
+        logger.debug("No expansions found for artwork: %s", artwork_id)
         return Response(
             content=[],
             media_type="application/json",
             status_code=HTTP_200_OK,
         )
 
-    # Build hierarchical tree structure
-    def build_tree(expansions, parent_id=None):
-        """Build tree structure from flat list of expansions."""
-        children = []
-        for expansion in expansions:
-            if expansion["parent_expansion_id"] == parent_id:
-                child = {
-                    "id": expansion["expansion_id"],
-                    "subject": expansion["subject"],
-                    "created_at": expansion["created_at"].isoformat(),
-                    "sub_expansions": build_tree(expansions, expansion["expansion_id"])
-                }
-                children.append(child)
-        
-        return children
-
-    # Build the tree starting from root expansions (parent_expansion_id = None)
-    tree = build_tree(all_expansions, None)
-
-    logger.info(f"Successfully built expansion tree with {len(tree)} root expansions for artwork: {artwork_id}")
+    # Build hierarchical tree structure in a single pass: each node's sub_expansions
+    # is the children list for its id, which is filled in whenever its children are seen
+    children = defaultdict(list)
+    for expansion in all_expansions:
+        children[expansion["parent_expansion_id"]].append(
+            {
+                "id": expansion["expansion_id"],
+                "subject": expansion["subject"],
+                "created_at": expansion["created_at"],
+                "sub_expansions": children[expansion["expansion_id"]],
+            }
+        )
+
+    # The tree starts from root expansions (parent_expansion_id = None)
+    tree = children[None]
+
+    logger.debug(
+        "Successfully built expansion tree with %d root expansions for artwork: %s",
+        len(tree),
+        artwork_id,
+    )
     return Response(
         content=tree,
         media_type="application/json",
@@ -2,15 +2,24 @@
 Controller for artwork explanation endpoints.
 """
 
+import asyncio
+import hashlib
 import logging
 import uuid
 from typing import Optional
 from litestar import Response, post, Request
+from litestar.background_tasks import BackgroundTask
 from litestar.datastructures import UploadFile
 from litestar.enums import RequestEncodingType
 from litestar.params import Body, Dependency
+from litestar.response import Redirect
+from litestar.status_codes import (
+    HTTP_303_SEE_OTHER,
+    HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+)
 from dataclasses import dataclass
 from dependencies.auth import AuthenticatedUser
+from middleware.upload_limit import UploadSizeLimitMiddleware
 from utils.image_processor import (
     processed_image_content_type,
     validate_and_process_image,
@@ -18,11 +27,11 @@ from utils.image_processor import (
 from services.base import AIService
 from services.storage.artwork_image_storage import ArtworkImageStorage
 from repositories.base import ArtworkRepository
+from utils.url_resolver import url_for
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+@dataclass(slots=True)
 class ExplainArtworkRequest:
     """Request data for explaining artwork by name."""
     
@@ -47,20 +56,21 @@ async def explain_artwork(
     Returns: XML with the artwork explanation
     """
     logger.info(
-        f"Received artwork explanation request by name: artwork_name={data.artwork_name}"
+        "Received artwork explanation request by name: artwork_name=%s",
+        data.artwork_name,
     )
 
-    # Generate unique artwork ID
-    artwork_id = str(uuid.uuid4())
+    # Generate unique artwork ID, passed to the database as a native UUID
+    artwork_id = uuid.uuid4()
 
     # Get authenticated user ID from injected dependency
     creator_user_id = authenticated_user.id if authenticated_user else None
-    logger.info(f"🔐 Controller: Authenticated user ID: {creator_user_id}")
+    logger.debug("🔐 Controller: Authenticated user ID: %s", creator_user_id)
 
     # Get explanation from AI using artwork name
     explanation_xml = await ai_service.explain_artwork_by_name(
         artwork_name=data.artwork_name,
-        cache_name=artwork_id,
+        cache_name=str(artwork_id),
     )
 
     # Save to database with creator user ID (no image path for name-based explanations)
@@ -71,7 +81,7 @@ async def explain_artwork(
         artwork_name=data.artwork_name,  # Store artwork name for name-based explanations
         creator_user_id=creator_user_id,
     )
-    logger.info(f"Saved artwork explanation to database: {artwork_id}")
+    logger.info("Saved artwork explanation to database: %s", artwork_id)
 
     # If user is authenticated, automatically save to their collection
     # if creator_user_id:
@@ -79,13 +89,24 @@ async def explain_artwork(
     #     logger.info(f"Auto-saved artwork to user's collection: {creator_user_id}")
 
     # Return redirect to the artwork endpoint
-    logger.info(f"Successfully generated artwork explanation response")
-    return Response(
-        content="", status_code=303, headers={"Location": request.url_for("get_artwork", artwork_id=artwork_id)}
-    )
+    logger.debug("Successfully generated artwork explanation response")
+    return _artwork_redirect(request, artwork_id)
 
 
-@post("/artwork/explain-from-image", name="explain_artwork_from_image")
+async def _save_to_collection(repository: ArtworkRepository, user_id: str, artwork_id: uuid.UUID) -> None:
+    """Save an artwork to the user's collection, logging instead of raising on failure."""
+    try:
+        await repository.save_user_artwork(user_id, artwork_id)
+        logger.info("Auto-saved artwork to user's collection: %s", user_id)
+    except Exception:
+        logger.exception("Failed to auto-save artwork %s to user's collection: %s", artwork_id, user_id)
+
+
+@post(
+    "/artwork/explain-from-image",
+    name="explain_artwork_from_image",
+    middleware=[UploadSizeLimitMiddleware],
+)
 async def explain_artwork_from_image(
     request: Request,
     data: UploadFile = Body(media_type=RequestEncodingType.MULTI_PART),
@@ -104,54 +125,95 @@ async def explain_artwork_from_image(
     Returns: XML with the artwork explanation
     """
     logger.info(
-        f"Received artwork explanation request: filename={data.filename}, "
-        f"content_type={data.content_type}"
+        "Received artwork explanation request: filename=%s, content_type=%s",
+        data.filename,
+        data.content_type,
     )
 
-    # Read image data
-    image_data = await data.read()
-    logger.info(f"Read uploaded file: {len(image_data)} bytes")
+    if not (data.content_type or "").startswith("image/"):
+        return Response(
+            content="Unsupported image type",
+            status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        )
 
-    # Validate and process image
-    processed_image_data = await validate_and_process_image(image_data)
-
-    # Generate unique artwork ID
-    artwork_id = str(uuid.uuid4())
+    # Validate and process image straight from the uploaded file
+    processed_image_data = await validate_and_process_image(data.file)
 
     # Get authenticated user ID from injected dependency
     creator_user_id = authenticated_user.id if authenticated_user else None
-    logger.info(f"🔐 Controller: Authenticated user ID: {creator_user_id}")
-
-    # Upload image to storage
-    image_path = await storage_service.upload_artwork_image(
-        artwork_id=artwork_id,
-        image_data=processed_image_data,
-        content_type=processed_image_content_type,
-    )
-    logger.info(f"Uploaded image to storage: {image_path}")
-
-    # Get explanation from AI
-    explanation_xml = await ai_service.explain_artwork(
-        processed_image_data,
-        cache_name=artwork_id,
+    logger.debug("🔐 Controller: Authenticated user ID: %s", creator_user_id)
+
+    # Reuse the existing artwork if this exact image was already explained
+    image_hash = hashlib.blake2b(processed_image_data, digest_size=16).hexdigest()
+    existing_artwork = await repository.get_artwork_by_image_hash(image_hash)
+    if existing_artwork is not None:
+        artwork_id = existing_artwork["artwork_id"]
+        logger.info("Found existing artwork for identical image: %s", artwork_id)
+
+        # If user is authenticated, automatically save to their collection once the
+        # redirect has been sent, the artwork endpoint doesn't depend on it
+        background = None
+        if creator_user_id:
+            background = BackgroundTask(_save_to_collection, repository, creator_user_id, artwork_id)
+        return _artwork_redirect(request, artwork_id, background)
+
+    # Generate unique artwork ID, passed to the database as a native UUID
+    artwork_id = uuid.uuid4()
+
+    # Upload the image and get its explanation concurrently, both only need the processed bytes
+    upload_result, explain_result = await asyncio.gather(
+        storage_service.upload_artwork_image(
+            artwork_id=artwork_id,
+            image_data=processed_image_data,
+            content_type=processed_image_content_type,
+        ),
+        ai_service.explain_artwork(processed_image_data, cache_name=str(artwork_id)),
+        return_exceptions=True,
     )
 
-    # Save to database with image path and creator user ID
-    await repository.save_artwork_explanation(
-        artwork_id=artwork_id,
-        explanation_xml=explanation_xml,
-        image_path=image_path,
-        creator_user_id=creator_user_id,
-    )
-    logger.info(f"Saved artwork explanation to database: {artwork_id}")
-
-    # If user is authenticated, automatically save to their collection
+    if isinstance(explain_result, BaseException):
+        # Don't leave an orphaned image behind when the explanation failed
+        if not isinstance(upload_result, BaseException):
+            try:
+                await storage_service.delete_artwork_image(upload_result)
+            except Exception:
+                logger.exception("Failed to remove image after explanation error: %s", upload_result)
+        raise explain_result
+    if isinstance(upload_result, BaseException):
+        raise upload_result
+
+    image_path, explanation_xml = upload_result, explain_result
+    logger.info("Uploaded image to storage: %s", image_path)
+
+    # Save to database with image path and image hash. If user is authenticated, the
+    # artwork is saved to their collection by the same statement.
     if creator_user_id:
-        await repository.save_user_artwork(creator_user_id, artwork_id)
-        logger.info(f"Auto-saved artwork to user's collection: {creator_user_id}")
-
-    # Return redirect to the artwork endpoint
-    logger.info(f"Successfully generated artwork explanation response")
-    return Response(
-        content="", status_code=303, headers={"Location": request.url_for("get_artwork", artwork_id=artwork_id)}
+        await repository.save_artwork_and_attach_user(
+            artwork_id=artwork_id,
+            explanation_xml=explanation_xml,
+            image_path=image_path,
+            user_id=creator_user_id,
+            image_hash=image_hash,
+        )
+    else:
+        await repository.save_artwork_explanation(
+            artwork_id=artwork_id,
+            explanation_xml=explanation_xml,
+            image_path=image_path,
+            image_hash=image_hash,
+        )
+    logger.info("Saved artwork explanation to database: %s", artwork_id)
+
+    logger.debug("Successfully generated artwork explanation response")
+    return _artwork_redirect(request, artwork_id)
+
+
+def _artwork_redirect(
+    request: Request, artwork_id: uuid.UUID, background: Optional[BackgroundTask] = None
+) -> Response:
+    """Redirect to the artwork endpoint, running the background task after the response is sent."""
+    return Redirect(
+        path=url_for(request, "get_artwork", artwork_id=artwork_id),
+        status_code=HTTP_303_SEE_OTHER,
+        background=background,
     )
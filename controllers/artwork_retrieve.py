@@ -2,16 +2,36 @@
 Controller for artwork retrieval endpoints.
 """
 
+import hashlib
 import logging
 from typing import Optional
 from litestar import Response, get, Request
-from litestar.status_codes import HTTP_200_OK, HTTP_404_NOT_FOUND
+from litestar.response import Redirect
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_302_FOUND,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+)
 from litestar.params import Dependency
+from litestar.serialization import encode_json
 from repositories.base import ArtworkRepository
 from services.storage.artwork_image_storage import ArtworkImageStorage
+from utils.cache import LRUCache, SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Encoded artwork responses and their ETags keyed by artwork ID, the only cache of
+# artwork records. The embedded image URL is public and never expires, so entries are
+# kept until evicted.
+_artwork_responses = LRUCache(maxsize=1024)
+
+# Concurrent cache misses for the same artwork share one database fetch
+_artwork_fetches = SingleFlight()
+
+# Image paths keyed by artwork ID
+_image_paths = LRUCache(maxsize=4096)
+
 
 @get("/artwork/{artwork_id:str}", name="get_artwork")
 async def get_artwork(
@@ -28,27 +48,46 @@ async def get_artwork(
 
     Returns: XML with the artwork explanation or 404 if not found
     """
-    logger.info(f"Received artwork retrieval request: artwork_id={artwork_id}")
-
-    # Retrieve artwork explanation from database
-    artwork_record = dict(await repository.get_artwork_explanation(artwork_id))
-    if artwork_record is None:
-        logger.warning(f"Artwork not found: {artwork_id}")
-        return Response(
-            content="Artwork not found",
-            status_code=HTTP_404_NOT_FOUND,
+    logger.debug("Received artwork retrieval request: artwork_id=%s", artwork_id)
+
+    # Serve the already encoded body when available
+    cached = _artwork_responses.get(artwork_id)
+    if cached is None:
+        # Retrieve artwork explanation from database
+        artwork_record = await _artwork_fetches.do(
+            artwork_id, repository.get_artwork_explanation, artwork_id
         )
-
-    # Generate image endpoint URL if available
-    if image_path := artwork_record.get("image_path"):
-        artwork_record["image_url"] = await storage_service.get_image_url(image_path)
-        del artwork_record["image_path"]
-
-    logger.info(f"Successfully retrieved artwork explanation: {artwork_id}")
+        if artwork_record is None:
+            logger.warning("Artwork not found: %s", artwork_id)
+            return Response(
+                content="Artwork not found",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+        artwork_record = dict(artwork_record)
+
+        # Generate image endpoint URL if available
+        if image_path := artwork_record.get("image_path"):
+            artwork_record["image_url"] = await storage_service.get_image_url(image_path)
+            del artwork_record["image_path"]
+
+        content = encode_json(artwork_record)
+        # The ETag follows the body rather than the artwork ID, so it changes if the
+        # embedded image URL ever does
+        etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        cached = (content, etag)
+        _artwork_responses.set(artwork_id, cached)
+
+    content, etag = cached
+    cache_headers = {"Cache-Control": "private, max-age=300", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(content=b"", status_code=HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    logger.debug("Successfully retrieved artwork explanation: %s", artwork_id)
     return Response(
-        content=artwork_record,
+        content=content,
         media_type="application/json",
         status_code=HTTP_200_OK,
+        headers=cache_headers,
     )
 
 
@@ -70,20 +109,25 @@ async def get_artwork_image(
 
     Returns: Redirect to the public URL of the image or 404 if not found
     """
-    logger.info(f"Received artwork image request: artwork_id={artwork_id}, size={size}")
-
-    # Retrieve artwork explanation from database
-    artwork_record = await repository.get_artwork_explanation(artwork_id)
-    if artwork_record is None:
-        logger.warning(f"Artwork not found: {artwork_id}")
-        return Response(
-            content="Artwork not found",
-            status_code=HTTP_404_NOT_FOUND,
-        )
+    logger.debug("Received artwork image request: artwork_id=%s, size=%s", artwork_id, size)
+
+    # Retrieve the image path from database, it never changes once the artwork is saved
+    image_path = _image_paths.get(artwork_id)
+    if image_path is None:
+        artwork_record = await repository.get_artwork_image_path(artwork_id)
+        if artwork_record is None:
+            logger.warning("Artwork not found: %s", artwork_id)
+            return Response(
+                content="Artwork not found",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+        image_path = artwork_record["image_path"]
+        if image_path:
+            _image_paths.set(artwork_id, image_path)
 
     # Check if image path exists
-    if not artwork_record["image_path"]:
-        logger.warning(f"No image path found for artwork: {artwork_id}")
+    if not image_path:
+        logger.warning("No image path found for artwork: %s", artwork_id)
         return Response(
             content="Image not found",
             status_code=HTTP_404_NOT_FOUND,
@@ -98,9 +142,13 @@ async def get_artwork_image(
 
     # Generate public URL for image with optional transformation
     image_url = await storage_service.get_image_url(
-        artwork_record["image_path"], width=width, height=height
+        image_path, width=width, height=height
     )
-    logger.info(f"Generated public URL for image: {artwork_record['image_path']}")
+    logger.debug("Generated public URL for image: %s", image_path)
+
+    # Public image URLs don't expire and an artwork's image never changes, so browsers
+    # and CDNs can remember the redirect for a day
+    cache_headers = {"Cache-Control": "public, max-age=86400"}
 
     # Return redirect to the public URL
-    return Response(content="", status_code=302, headers={"Location": image_url})
+    return Redirect(path=image_url, status_code=HTTP_302_FOUND, headers=cache_headers)
@@ -3,9 +3,12 @@ Controller for user artwork endpoints.
 """
 
 import logging
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
+import msgspec
 from litestar import Response, get, Request
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import HTTP_200_OK, HTTP_403_FORBIDDEN
 from litestar.params import Dependency
 from dependencies.auth import AuthenticatedUser
 from repositories.base import ArtworkRepository
@@ -14,6 +17,16 @@ from services.storage.artwork_image_storage import ArtworkImageStorage
 logger = logging.getLogger(__name__)
 
 
+class ArtworkCard(msgspec.Struct):
+    """Artwork metadata shown in a user's collection, encoded directly by msgspec."""
+
+    artwork_id: UUID
+    artwork_name: Optional[str]
+    creator_user_id: Optional[UUID]
+    created_at: datetime
+    image_url: Optional[str] = None
+
+
 @get("/user/{user_id:str}/artworks", name="get_user_artworks")
 async def get_user_artworks(
     request: Request,
@@ -28,35 +41,48 @@ async def get_user_artworks(
     Path parameter:
         user_id: The unique identifier for the user
 
-    Returns: JSON array with artwork metadata (no XML) or 404 if user not found
+    Returns: JSON array with artwork metadata (no XML), or 403 if the authenticated
+    user is a different user
     """
-    logger.info(f"Received user artworks request: user_id={user_id}")
-
-    # Retrieve user's saved artworks from database
-    saved_artworks = dict(await repository.get_user_saved_artworks(user_id))
-
-    for artwork in saved_artworks:
-        if image_path := artwork.get("image_path"):
-            artwork["image_url"] = await storage_service.get_image_url(image_path)
-            del artwork["image_path"]
+    logger.debug("Received user artworks request: user_id=%s", user_id)
 
     # Get authenticated user ID from injected dependency
     authenticated_user_id = authenticated_user.id if authenticated_user else None
-    logger.info(
-        f"🔍 Controller: Authenticated user ID from JWT: {authenticated_user_id}"
-    )
+    logger.debug("Authenticated user ID from JWT: %s", authenticated_user_id)
 
-    # Optional: You can verify the authenticated user matches the requested user_id
+    # Authenticated users may only read their own collection, checked before any work is done
     if authenticated_user_id and authenticated_user_id != user_id:
         logger.warning(
-            f"⚠️ User {authenticated_user_id} is accessing artworks of user {user_id}"
+            "User %s is not allowed to access artworks of user %s", authenticated_user_id, user_id
+        )
+        return Response(
+            content="Forbidden",
+            status_code=HTTP_403_FORBIDDEN,
+        )
+
+    # Retrieve user's saved artworks from database
+    saved_artworks = await repository.get_user_saved_artworks(user_id)
+
+    # Resolve all image URLs in one batch
+    image_urls = await storage_service.get_image_urls(
+        [artwork["image_path"] for artwork in saved_artworks]
+    )
+    artwork_cards = [
+        ArtworkCard(
+            artwork_id=artwork["artwork_id"],
+            artwork_name=artwork["artwork_name"],
+            creator_user_id=artwork["creator_user_id"],
+            created_at=artwork["created_at"],
+            image_url=image_url,
         )
+        for artwork, image_url in zip(saved_artworks, image_urls)
+    ]
 
-    logger.info(
-        f"Successfully retrieved {len(saved_artworks)} artworks for user: {user_id}"
+    logger.debug(
+        "Successfully retrieved %d artworks for user: %s", len(artwork_cards), user_id
     )
     return Response(
-        content=saved_artworks,
+        content=artwork_cards,
         media_type="application/json",
         status_code=HTTP_200_OK,
     )
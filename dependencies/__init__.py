@@ -1,9 +1,10 @@
 """Dependencies module."""
 
-from dependencies.ai_provider import get_ai_service, get_settings
+from dependencies.ai_provider import create_ai_service, get_ai_service, get_settings
 from dependencies.auth import authenticated_user_provider, AuthenticatedUser
 
 __all__ = [
+    "create_ai_service",
     "get_ai_service",
     "get_settings",
     "authenticated_user_provider",
@@ -2,32 +2,36 @@
 Dependency injection for AI provider services.
 """
 
+from litestar.datastructures import State
 from config.settings import Settings, AIProvider
-from services.gemini_service import GeminiService
-from services.openai_service import OpenAIService
 from services.base import AIService
 
 
-def get_settings() -> Settings:
+def get_settings(state: State) -> Settings:
     """
     Dependency provider that returns the application settings instance.
 
+    The instance is created once at startup and stored in the application state.
+
+    Args:
+        state: Application state (injected by Litestar)
+
     Returns:
         Settings: The application settings instance
     """
-    return Settings()
+    return state.settings
 
 
-def get_ai_service(settings: Settings) -> AIService:
+def create_ai_service(settings: Settings) -> AIService:
     """
-    Dependency provider that returns the configured AI service instance.
+    Create the configured AI service instance.
 
     Configuration (API keys) is injected from Settings into the service instance.
     Services don't load environment variables directly - they receive configuration
     through constructor injection following the Dependency Inversion Principle.
 
     Args:
-        settings: Application settings (injected dependency)
+        settings: Application settings
 
     Returns:
         GeminiService instance implementing the AIService protocol
@@ -35,9 +39,30 @@ def get_ai_service(settings: Settings) -> AIService:
     Raises:
         ValueError: If an invalid provider is configured
     """
+    # Provider SDKs are imported on first use so only the configured one is loaded
     if settings.AI_PROVIDER == AIProvider.GEMINI:
+        from services.gemini_service import GeminiService
+
         return GeminiService(api_key=settings.GOOGLE_API_KEY)
     elif settings.AI_PROVIDER == AIProvider.OPENAI:
+        from services.openai_service import OpenAIService
+
         return OpenAIService(api_key=settings.OPENAI_API_KEY)
     else:
         raise ValueError(f"Invalid AI provider: {settings.AI_PROVIDER}. Supported providers: gemini, openai")
+
+
+def get_ai_service(state: State) -> AIService:
+    """
+    Dependency provider that returns the shared AI service instance.
+
+    The instance is created once at startup and stored in the application state, so
+    the provider client and its connections are reused across requests.
+
+    Args:
+        state: Application state (injected by Litestar)
+
+    Returns:
+        AIService implementation for the configured provider
+    """
+    return state.ai_service
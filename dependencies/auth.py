@@ -11,7 +11,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticatedUser:
     """Represents an authenticated user from JWT token."""
 
@@ -23,21 +23,21 @@ class AuthenticatedUser:
             raise ValueError("AuthenticatedUser must have a valid ID")
 
 
-async def get_authenticated_user(request: Request) -> Optional[AuthenticatedUser]:
+def get_authenticated_user(request: Request) -> Optional[AuthenticatedUser]:
     """
     Dependency provider that extracts the authenticated user from the request.
 
     The JWT middleware sets request.user to the user ID (sub claim from token).
     This dependency wraps it in an AuthenticatedUser object for cleaner access.
+    It does no I/O, so it is a plain function; Litestar resolves it at most once
+    per request.
 
     Returns:
         AuthenticatedUser if user is authenticated, None otherwise.
     """
-    user_id = request.user if hasattr(request, "user") else None
+    user_id = request.scope.get("user")
 
-    logger.debug(
-        f"🔐 Auth Dependency: Extracting user from request - user_id: {user_id}"
-    )
+    logger.debug("🔐 Auth Dependency: Extracting user from request - user_id: %s", user_id)
 
     # Only create AuthenticatedUser if we have a valid user ID
     if user_id:
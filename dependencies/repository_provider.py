@@ -2,83 +2,124 @@
 Dependency injection for repository services with connection pooling support.
 """
 
+import logging
 import os
 from typing import Optional, Protocol, runtime_checkable
 from contextlib import asynccontextmanager
+from litestar.datastructures import State
 from config.settings import Settings
 from repositories.artwork_repository import ArtworkRepositoryImpl
 from repositories.base import ArtworkRepository
+from repositories.cached_artwork_repository import CachedArtworkRepository
 
+logger = logging.getLogger(__name__)
 
-# Global connection pool for PostgreSQL
-_postgres_pool: Optional[object] = None
+# Database schema, read once when the module is imported
+with open(os.path.join(os.path.dirname(__file__), "..", "repositories", "schema.sql"), "r") as schema_file:
+    _SCHEMA_SQL = schema_file.read()
 
+# True when artwork_explanations predates the image_hash column
+_MISSING_IMAGE_HASH_SQL = """
+SELECT to_regclass('artwork_explanations') IS NOT NULL
+   AND NOT EXISTS (
+       SELECT 1 FROM information_schema.columns
+       WHERE table_name = 'artwork_explanations' AND column_name = 'image_hash'
+   )
+"""
 
 
-async def initialize_database(settings: Settings) -> None:
+async def initialize_database(settings: Settings):
     """
-    Initialize the database connection and create tables from schema.sql.
-    Should be called on application startup.
+    Initialize the database connection pool and create tables from schema.sql.
+    Should be called on application startup; the caller owns the returned pool.
 
     Args:
         settings: Application settings containing DATABASE_URL
+
+    Returns:
+        The connection pool, to be stored in the application state
     """
     if settings.DATABASE_DRIVER_ADAPTER == "asyncpg":
         import asyncpg
-        from urllib.parse import urlparse
 
-        global _postgres_pool
-
-        # Parse the database URL
-        parsed_url = urlparse(
-            settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
-        )
+        dsn = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+
+        # Keep all replicas together within a share of the server's connection limit
+        max_size = settings.POSTGRES_MAX_CONNECTIONS
+        if settings.POSTGRES_POOL_PERCENT > 0:
+            connection = await asyncpg.connect(dsn=dsn)
+            try:
+                server_max = await connection.fetchval(
+                    "SELECT current_setting('max_connections')::int"
+                )
+            finally:
+                await connection.close()
+
+            replicas = max(settings.POSTGRES_REPLICAS, 1)
+            replica_share = server_max * settings.POSTGRES_POOL_PERCENT // 100 // replicas
+            max_size = max(settings.POSTGRES_MIN_CONNECTIONS, min(max_size, replica_share))
+            logger.info(
+                "PostgreSQL pool max size set to %d (server max_connections=%d)",
+                max_size,
+                server_max,
+            )
 
-        # Create connection pool
-        _postgres_pool = await asyncpg.create_pool(
-            host=parsed_url.hostname,
-            port=parsed_url.port or 5432,
-            user=parsed_url.username,
-            password=parsed_url.password,
-            database=parsed_url.path[1:],  # Remove leading slash
+        # Create connection pool, asyncpg parses the URL including any libpq-style options
+        pool = await asyncpg.create_pool(
+            dsn=dsn,
             min_size=settings.POSTGRES_MIN_CONNECTIONS,
-            max_size=settings.POSTGRES_MAX_CONNECTIONS,
+            max_size=max_size,
             command_timeout=settings.POSTGRES_COMMAND_TIMEOUT,
+            statement_cache_size=settings.POSTGRES_STATEMENT_CACHE_SIZE,
+            max_inactive_connection_lifetime=settings.POSTGRES_MAX_IDLE_SECONDS,
         )
 
-        # Read and execute schema
-        schema_path = os.path.join(
-            os.path.dirname(__file__), "..", "repositories", "schema.sql"
-        )
-        with open(schema_path, "r") as f:
-            schema_sql = f.read()
+        # Execute schema using the pool. The script is sent as one simple query, which
+        # Postgres already runs as a single implicit transaction.
+        async with pool.acquire() as connection:
+            # schema.sql only creates missing objects, changes to existing tables are
+            # hand-run migrations. Fail with a clear message when one is missing.
+            needs_image_hash_migration = await connection.fetchval(_MISSING_IMAGE_HASH_SQL)
+            if not needs_image_hash_migration:
+                await connection.execute(_SCHEMA_SQL)
+
+        if needs_image_hash_migration:
+            await pool.close()
+            raise RuntimeError(
+                "artwork_explanations has no image_hash column, apply "
+                "repositories/migrations/001_add_artwork_image_hash.sql first"
+            )
 
-        # Execute schema using the pool
-        async with _postgres_pool.acquire() as connection:
-            await connection.execute(schema_sql)
+        return pool
     else:
         raise ValueError(
             f"Database initialization not implemented: {settings.DATABASE_DRIVER_ADAPTER}"
         )
 
 
-async def shutdown_database() -> None:
+async def shutdown_database(pool) -> None:
     """
     Cleanup database connections.
     Should be called on application shutdown.
+
+    Args:
+        pool: The connection pool returned by initialize_database
     """
-    global _postgres_pool
-    if _postgres_pool:
-        await _postgres_pool.close()
-        _postgres_pool = None
+    if pool:
+        await pool.close()
 
 
-async def get_artwork_repository(settings: Settings) -> ArtworkRepository:
+def create_artwork_repository(settings: Settings, pool) -> ArtworkRepository:
     """
-    Get an artwork repository instance with appropriate connection manager.
+    Create an artwork repository instance with appropriate connection manager.
+
+    The repository only holds a reference to the connection pool, so a single
+    instance is created at startup and shared by all requests. Reads of immutable
+    records go through an in-process cache in front of the database.
 
     Args:
         settings: Application settings containing database configuration
+        pool: The connection pool returned by initialize_database
 
     Returns:
         ArtworkRepository instance configured for the specified database
@@ -87,18 +128,31 @@ async def get_artwork_repository(settings: Settings) -> ArtworkRepository:
         ValueError: If the database driver adapter is not supported
     """
     if settings.DATABASE_DRIVER_ADAPTER == "asyncpg":
-        global _postgres_pool
-
-        if not _postgres_pool:
+        if not pool:
             raise RuntimeError(
                 "PostgreSQL connection pool not initialized. Call initialize_database() first."
             )
 
-        return ArtworkRepositoryImpl(
-            # aiosql implicitly handles the connection for us.
-            settings.DATABASE_DRIVER_ADAPTER, _postgres_pool 
+        return CachedArtworkRepository(
+            ArtworkRepositoryImpl(
+                # aiosql acquires a pooled connection per query for us.
+                settings.DATABASE_DRIVER_ADAPTER, pool
+            )
         )
     else:
         raise ValueError(
             f"Unsupported database driver adapter: {settings.DATABASE_DRIVER_ADAPTER}"
         )
+
+
+def get_artwork_repository(state: State) -> ArtworkRepository:
+    """
+    Dependency provider that returns the shared artwork repository.
+
+    Args:
+        state: Application state (injected by Litestar)
+
+    Returns:
+        ArtworkRepository instance created at startup
+    """
+    return state.repository
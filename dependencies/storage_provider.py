@@ -2,15 +2,19 @@
 Artwork storage service dependency provider.
 """
 
+from litestar.datastructures import State
 from litestar.di import Provide
 from services.storage.object_storage import ObjectStorageService
 from services.storage.artwork_image_storage import ArtworkImageStorage
 from config.settings import Settings
 
 
-def get_artwork_storage_service(settings: Settings) -> ArtworkImageStorage:
+def create_artwork_storage_service(settings: Settings) -> ArtworkImageStorage:
     """
-    Create and return an artwork storage service instance.
+    Create an artwork storage service instance.
+
+    The storage client is reusable across requests, so a single instance is
+    created at startup and shared.
 
     Args:
         settings: Application settings containing storage configuration
@@ -30,5 +34,18 @@ def get_artwork_storage_service(settings: Settings) -> ArtworkImageStorage:
     return ArtworkImageStorage(object_storage)
 
 
+def get_artwork_storage_service(state: State) -> ArtworkImageStorage:
+    """
+    Dependency provider that returns the shared artwork storage service.
+
+    Args:
+        state: Application state (injected by Litestar)
+
+    Returns:
+        Artwork storage service instance created at startup
+    """
+    return state.storage_service
+
+
 # Dependency provider for Litestar
 artwork_storage_provider = Provide(get_artwork_storage_service, sync_to_thread=False)
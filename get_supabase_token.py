@@ -57,10 +57,11 @@ class SupabaseTokenHelper:
     def get_user_info(self, token: str) -> Optional[Dict[str, Any]]:
         """Get user information from JWT token"""
         url = f"{self.supabase_url}/auth/v1/user"
-        headers = {"Authorization": f"Bearer {token}", "apikey": self.supabase_anon_key}
+        headers = {"Authorization": f"Bearer {token}"}
 
         try:
-            response = requests.get(url, headers=headers)
+            # Reuse the session's connection (and its apikey header) from sign in
+            response = self.session.get(url, headers=headers)
             if response.status_code == 200:
                 return response.json()
             else:
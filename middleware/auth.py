@@ -7,22 +7,73 @@ without the header to pass through without authentication.
 """
 
 import logging
-from typing import Optional, Any
+import time
+from typing import Optional, Any, Union
 from litestar.security.jwt import JWTAuthenticationMiddleware
 from litestar.connection import ASGIConnection
+from litestar.exceptions import NotAuthorizedException
+from litestar.middleware.authentication import AuthenticationResult
 from litestar.security.jwt import JWTAuth, Token
 from litestar.types import Scope, Send
+from utils.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Decoded tokens keyed by the raw JWT and the options it was verified with, so
+# repeated requests with the same token skip signature verification and payload parsing.
+_decoded_tokens = LRUCache(maxsize=4096)
 
-def _retrieve_user(token: Token, connection) -> Optional[str]:
+
+def _retrieve_user(token: Token, connection: ASGIConnection, /) -> Optional[str]:
     """Extract user ID from JWT token. Returns None if no token or invalid token."""
+    # The return value is automatically made available as request.user
+    return token.sub or None
 
-    user_id = token.sub if token.sub else None
 
-    # The return value is automatically made available as request.user
-    return user_id
+def _decode_cache_key(
+    encoded_token: Union[str, bytes], secret: str, algorithm: str, options: dict
+) -> tuple:
+    """Build a hashable cache key from the token and every option it is decoded with."""
+    return (
+        encoded_token,
+        secret,
+        algorithm,
+        tuple(
+            sorted(
+                (name, tuple(value) if isinstance(value, (list, tuple, set, frozenset)) else value)
+                for name, value in options.items()
+            )
+        ),
+    )
+
+
+class CachedToken(Token):
+    """
+    Token that caches decoded instances per encoded token and decode options.
+
+    Audience, issuer and verification options are part of the cache key, so a token
+    is only reused when it would be verified the same way. Expiry and not-before are
+    re-checked on every cache hit; a token outside its validity window is evicted and
+    decoded again, which rejects it.
+    """
+
+    @classmethod
+    def decode(
+        cls, encoded_token: Union[str, bytes], secret: str, algorithm: str, **kwargs: Any
+    ):
+        cache_key = _decode_cache_key(encoded_token, secret, algorithm, kwargs)
+        token = _decoded_tokens.get(cache_key)
+        if token is not None:
+            # Token has no nbf field, the claim is kept in extras when present
+            now = time.time()
+            nbf = token.extras.get("nbf")
+            if token.exp.timestamp() > now and (nbf is None or nbf <= now):
+                return token
+            _decoded_tokens.pop(cache_key)
+
+        token = super().decode(encoded_token, secret, algorithm, **kwargs)
+        _decoded_tokens.set(cache_key, token)
+        return token
 
 
 class AuthMiddleware(JWTAuthenticationMiddleware):
@@ -32,12 +83,33 @@ class AuthMiddleware(JWTAuthenticationMiddleware):
 
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
+        # ASGI header names are lowercase bytes
+        self.auth_header_key = self.auth_header.lower().encode("latin-1")
 
-    async def __call__(self, scope: Scope, receive, send: Send) -> None:
-        connection = ASGIConnection(scope, receive, send)
-        auth_header = connection.headers.get(self.auth_header)
+    def _get_auth_header(self, scope: Scope) -> Optional[bytes]:
+        """Find the raw auth header value in the ASGI scope with a single pass."""
+        for name, value in scope["headers"]:
+            if name == self.auth_header_key:
+                return value
+        return None
 
+    async def authenticate_request(
+        self, connection: ASGIConnection
+    ) -> AuthenticationResult:
+        """Authenticate from the raw header bytes, without building a headers mapping."""
+        auth_header = self._get_auth_header(connection.scope)
         if not auth_header:
+            raise NotAuthorizedException("No JWT token found in request header")
+
+        # PyJWT accepts bytes, so the token is never decoded to str
+        encoded_token = auth_header.partition(b" ")[-1]
+        return await self.authenticate_token(
+            encoded_token=encoded_token, connection=connection
+        )
+
+    async def __call__(self, scope: Scope, receive, send: Send) -> None:
+        # Checked on the raw scope headers so anonymous requests build no connection
+        if not self._get_auth_header(scope):
             # No auth header provided, set user to None and continue to the app
             scope["user"] = None
             await self.app(scope, receive, send)
@@ -51,4 +123,5 @@ def create_auth(**kwargs):
         **kwargs,
         retrieve_user_handler=_retrieve_user,
         authentication_middleware_class=AuthMiddleware,
+        token_cls=CachedToken,
     )
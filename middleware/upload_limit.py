@@ -0,0 +1,54 @@
+"""
+Upload size limiting middleware for Litestar.
+
+Litestar reads the whole request body into memory before parsing a multipart form,
+so the size limit is enforced on the bytes as they are received rather than only on
+the declared Content-Length, which chunked uploads don't send.
+"""
+
+import logging
+from litestar.exceptions import ClientException
+from litestar.status_codes import HTTP_413_REQUEST_ENTITY_TOO_LARGE
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Middleware that rejects request bodies larger than MAX_UPLOAD_SIZE with 413.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        max_size = scope["app"].state.settings.MAX_UPLOAD_SIZE
+
+        # Reject a declared oversized body before any of it is read
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > max_size:
+                    logger.warning("Rejected upload of %s bytes", value.decode("latin-1"))
+                    raise ClientException(
+                        detail="Image too large",
+                        status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    )
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_size:
+                    logger.warning("Rejected upload exceeding %d bytes", max_size)
+                    raise ClientException(
+                        detail="Image too large",
+                        status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -4,5 +4,6 @@ Repository layer for data persistence.
 
 from repositories.base import ArtworkRepository
 from repositories.artwork_repository import ArtworkRepositoryImpl
+from repositories.cached_artwork_repository import CachedArtworkRepository
 
-__all__ = ["ArtworkRepository", "ArtworkRepositoryImpl"]
+__all__ = ["ArtworkRepository", "ArtworkRepositoryImpl", "CachedArtworkRepository"]
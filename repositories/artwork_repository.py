@@ -1,28 +1,42 @@
 """
-Artwork repository implementation using aiosql and raw database connections.
+Artwork repository implementation using aiosql and a database connection pool.
 """
 
+import os
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 import aiosql
 from repositories.base import ArtworkRepository
 
+_QUERIES_PATH = os.path.join(os.path.dirname(__file__), "queries", "artwork_queries.sql")
+
+# Parsed queries keyed by driver adapter, so the SQL file is only loaded once
+_queries_by_adapter: Dict[Any, Any] = {}
+
+
+def _load_queries(driver_adapter):
+    queries = _queries_by_adapter.get(driver_adapter)
+    if queries is None:
+        queries = aiosql.from_path(_QUERIES_PATH, driver_adapter=driver_adapter)
+        _queries_by_adapter[driver_adapter] = queries
+    return queries
+
 
 class ArtworkRepositoryImpl(ArtworkRepository):
 
-    def __init__(self, driver_adapter, connection):
+    def __init__(self, driver_adapter, pool):
         self.driver_adapter = driver_adapter
-        self.connection = connection
-        self.queries = aiosql.from_path(
-            "repositories/queries/artwork_queries.sql", driver_adapter=driver_adapter
-        )
+        # aiosql acquires a connection from the pool for each query and releases it
+        # afterwards, so concurrent calls run on separate connections
+        self.pool = pool
+        self.queries = _load_queries(driver_adapter)
 
     async def get_cached_subject_expansion(
         self, artwork_id: str, subject: str, parent_expansion_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         results = await self.queries.get_cached_subject_expansion(
-            self.connection, artwork_id=artwork_id, subject=subject, parent_expansion_id=parent_expansion_id
+            self.pool, artwork_id=artwork_id, subject=subject, parent_expansion_id=parent_expansion_id
         )
 
         if not results or len(results) == 0:
@@ -32,33 +46,90 @@ class ArtworkRepositoryImpl(ArtworkRepository):
 
     async def save_artwork_explanation(
         self,
-        artwork_id: str,
+        artwork_id: Union[str, uuid.UUID],
         explanation_xml: str,
         image_path: Optional[str] = None,
         artwork_name: Optional[str] = None,
         creator_user_id: Optional[str] = None,
+        image_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
         now = datetime.utcnow()
 
-        if creator_user_id:
-            await self.queries.ensure_user_profile(
-                self.connection,
-                user_id=creator_user_id,
-            )
-
-        return await self.queries.save_artwork_explanation(
-            self.connection,
+        # Artworks created by a user also make sure the user's profile exists, in one statement
+        save_query = (
+            self.queries.save_artwork_explanation_with_user
+            if creator_user_id
+            else self.queries.save_artwork_explanation
+        )
+        return await save_query(
+            self.pool,
             artwork_id=artwork_id,
             explanation_xml=explanation_xml,
             image_path=image_path,
             artwork_name=artwork_name,
             creator_user_id=creator_user_id,
+            image_hash=image_hash,
             created_at=now,
         )
 
+    async def save_artwork_and_attach_user(
+        self,
+        artwork_id: Union[str, uuid.UUID],
+        explanation_xml: str,
+        user_id: str,
+        image_path: Optional[str] = None,
+        artwork_name: Optional[str] = None,
+        image_hash: Optional[str] = None,
+    ) -> None:
+        now = datetime.utcnow()
+
+        await self.queries.save_artwork_and_attach_user(
+            self.pool,
+            artwork_id=artwork_id,
+            explanation_xml=explanation_xml,
+            image_path=image_path,
+            artwork_name=artwork_name,
+            user_id=user_id,
+            image_hash=image_hash,
+            created_at=now,
+        )
+
+    async def get_artwork_by_image_hash(self, image_hash: str) -> Optional[Dict[str, Any]]:
+        results = await self.queries.get_artwork_by_image_hash(
+            self.pool,
+            image_hash=image_hash
+        )
+
+        if not results or len(results) == 0:
+            return None
+
+        return results[0]
+
     async def get_artwork_explanation(self, artwork_id: str) -> Optional[Dict[str, Any]]:
         results = await self.queries.get_artwork_explanation(
-            self.connection,
+            self.pool,
+            artwork_id=artwork_id
+        )
+
+        if not results or len(results) == 0:
+            return None
+
+        return results[0]
+
+    async def get_artwork_explanation_xml(self, artwork_id: str) -> Optional[str]:
+        results = await self.queries.get_artwork_explanation_xml(
+            self.pool,
+            artwork_id=artwork_id
+        )
+
+        if not results or len(results) == 0:
+            return None
+
+        return results[0]["explanation_xml"]
+
+    async def get_artwork_image_path(self, artwork_id: str) -> Optional[Dict[str, Any]]:
+        results = await self.queries.get_artwork_image_path(
+            self.pool,
             artwork_id=artwork_id
         )
 
@@ -75,10 +146,10 @@ class ArtworkRepositoryImpl(ArtworkRepository):
         parent_expansion_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         now = datetime.utcnow()
-        expansion_id = str(uuid.uuid4())
+        expansion_id = uuid.uuid4()
 
-        await self.queries.save_subject_expansion(
-            self.connection,
+        results = await self.queries.save_subject_expansion(
+            self.pool,
             expansion_id=expansion_id,
             artwork_id=artwork_id,
             subject=subject,
@@ -87,17 +158,13 @@ class ArtworkRepositoryImpl(ArtworkRepository):
             created_at=now,
         )
 
-        saved_record = await self.get_subject_expansion(expansion_id)
-        if saved_record is None:
-            raise ValueError(f"Failed to retrieve saved expansion: {expansion_id}")
-
-        return saved_record
+        return results[0]
 
     async def get_subject_expansion(
         self, expansion_id: str
     ) -> Optional[Dict[str, Any]]:
         results = await self.queries.get_subject_expansion(
-            self.connection, expansion_id=expansion_id
+            self.pool, expansion_id=expansion_id
         )
 
         if not results or len(results) == 0:
@@ -109,16 +176,18 @@ class ArtworkRepositoryImpl(ArtworkRepository):
         self, artwork_id: str
     ) -> list[Dict[str, Any]]:
         results = await self.queries.get_subject_expansions(
-            self.connection, artwork_id=artwork_id
+            self.pool, artwork_id=artwork_id
         )
 
         return results
 
-    async def save_user_artwork(self, user_id: str, artwork_id: str) -> None:
+    async def save_user_artwork(self, user_id: str, artwork_id: Union[str, uuid.UUID]) -> None:
         now = datetime.utcnow()
 
+        # The artwork may have been created by another user, the query also makes sure
+        # this one has a profile
         await self.queries.save_user_artwork(
-            self.connection,
+            self.pool,
             user_id=user_id,
             artwork_id=artwork_id,
             saved_at=now,
@@ -126,7 +195,7 @@ class ArtworkRepositoryImpl(ArtworkRepository):
 
     async def get_user_saved_artworks(self, user_id: str) -> list[Dict[str, Any]]:
         results = await self.queries.get_user_saved_artworks(
-            self.connection, user_id=user_id
+            self.pool, user_id=user_id
         )
 
         return results
@@ -135,7 +204,7 @@ class ArtworkRepositoryImpl(ArtworkRepository):
         self, artwork_id: str
     ) -> list[Dict[str, Any]]:
         results = await self.queries.get_all_expansions_with_hierarchy(
-            self.connection, artwork_id=artwork_id
+            self.pool, artwork_id=artwork_id
         )
 
         return results
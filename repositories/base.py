@@ -2,7 +2,8 @@
 Base protocol for artwork repositories.
 """
 
-from typing import Protocol, Optional, runtime_checkable, Dict, Any
+from typing import Protocol, Optional, runtime_checkable, Dict, Any, Union
+from uuid import UUID
 
 
 @runtime_checkable
@@ -13,11 +14,12 @@ class ArtworkRepository(Protocol):
 
     async def save_artwork_explanation(
         self,
-        artwork_id: str,
+        artwork_id: Union[str, UUID],
         explanation_xml: str,
         image_path: Optional[str] = None,
         artwork_name: Optional[str] = None,
         creator_user_id: Optional[str] = None,
+        image_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Save an artwork explanation to the repository.
@@ -28,6 +30,7 @@ class ArtworkRepository(Protocol):
             image_path: Path to the image in storage (optional)
             artwork_name: Name of the artwork (for name-based explanations, optional)
             creator_user_id: User who created/uploaded the artwork (optional for anonymous)
+            image_hash: Hash of the processed image (optional)
 
         Returns:
             Dict with the saved data including timestamp
@@ -52,6 +55,76 @@ class ArtworkRepository(Protocol):
         """
         ...
 
+    async def save_artwork_and_attach_user(
+        self,
+        artwork_id: Union[str, UUID],
+        explanation_xml: str,
+        user_id: str,
+        image_path: Optional[str] = None,
+        artwork_name: Optional[str] = None,
+        image_hash: Optional[str] = None,
+    ) -> None:
+        """
+        Save an artwork explanation created by a user and add it to their collection.
+
+        Args:
+            artwork_id: Unique identifier for the artwork
+            explanation_xml: The XML interpretation of the artwork
+            user_id: User who created/uploaded the artwork
+            image_path: Path to the image in storage (optional)
+            artwork_name: Name of the artwork (for name-based explanations, optional)
+            image_hash: Hash of the processed image (optional)
+
+        Raises:
+            Exception: If save operation fails
+        """
+        ...
+
+    async def get_artwork_explanation_xml(self, artwork_id: str) -> Optional[str]:
+        """
+        Retrieve only the explanation XML of an artwork.
+
+        Args:
+            artwork_id: Unique identifier for the artwork
+
+        Returns:
+            The explanation XML if found, None otherwise
+
+        Raises:
+            Exception: If retrieval operation fails
+        """
+        ...
+
+    async def get_artwork_image_path(self, artwork_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve only the image path of an artwork.
+
+        Args:
+            artwork_id: Unique identifier for the artwork
+
+        Returns:
+            Dict with the image_path (None for name-based artworks) if found, None otherwise
+
+        Raises:
+            Exception: If retrieval operation fails
+        """
+        ...
+
+    async def get_artwork_by_image_hash(self, image_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the artwork explained from an image with the given hash.
+
+        Args:
+            image_hash: Hash of the processed image
+
+        Returns:
+            Dict with the artwork_id if found, None otherwise
+
+        Raises:
+            Exception: If retrieval operation fails
+        """
+        ...
+
     async def save_subject_expansion(
         self,
         artwork_id: str,
@@ -110,7 +183,7 @@ class ArtworkRepository(Protocol):
         """
         ...
 
-    async def save_user_artwork(self, user_id: str, artwork_id: str) -> None:
+    async def save_user_artwork(self, user_id: str, artwork_id: Union[str, UUID]) -> None:
         """
         Save an artwork to a user's collection.
 
@@ -148,7 +221,7 @@ class ArtworkRepository(Protocol):
             artwork_id: Reference to the original artwork
 
         Returns:
-            List of Dict with all expansions in hierarchy order
+            List of Dict with the tree fields of all expansions (no XML) in hierarchy order
 
         Raises:
             Exception: If retrieval operation fails
@@ -167,7 +240,7 @@ class ArtworkRepository(Protocol):
             parent_expansion_id: Optional parent expansion ID for context
 
         Returns:
-            Dict if found in cache, None otherwise
+            Dict with the expansion_id if found in cache, None otherwise
 
         Raises:
             Exception: If retrieval operation fails
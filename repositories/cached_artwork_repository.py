@@ -0,0 +1,145 @@
+"""
+Artwork repository decorator that caches immutable records in process memory.
+"""
+
+from typing import Optional, Dict, Any, Union
+from uuid import UUID
+from repositories.base import ArtworkRepository
+from utils.cache import LRUCache
+
+
+class CachedArtworkRepository(ArtworkRepository):
+    """
+    Cache-aside wrapper around another artwork repository.
+
+    Only the lookups behind subject expansions are cached here; artwork and expansion
+    reads are cached as encoded responses by their controllers. Explanations and
+    expansions never change once saved, so found records are kept until evicted.
+    Lookups that find nothing are not cached, another replica may save the record
+    at any time.
+    """
+
+    def __init__(self, repository: ArtworkRepository, maxsize: int = 4096):
+        """
+        Initialize the cached repository.
+
+        Args:
+            repository: The repository reads fall through to
+            maxsize: Maximum number of entries kept per cache
+        """
+        self.repository = repository
+        # Explanation XML keyed by artwork ID, used as prompt context for expansions
+        self._explanation_xmls = LRUCache(maxsize=maxsize)
+        # Cached expansion lookups keyed by (artwork_id, subject, parent_expansion_id)
+        self._subject_expansions = LRUCache(maxsize=maxsize)
+
+    async def save_artwork_explanation(
+        self,
+        artwork_id: Union[str, UUID],
+        explanation_xml: str,
+        image_path: Optional[str] = None,
+        artwork_name: Optional[str] = None,
+        creator_user_id: Optional[str] = None,
+        image_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return await self.repository.save_artwork_explanation(
+            artwork_id=artwork_id,
+            explanation_xml=explanation_xml,
+            image_path=image_path,
+            artwork_name=artwork_name,
+            creator_user_id=creator_user_id,
+            image_hash=image_hash,
+        )
+
+    async def get_artwork_explanation(self, artwork_id: str) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_artwork_explanation(artwork_id)
+
+    async def save_artwork_and_attach_user(
+        self,
+        artwork_id: Union[str, UUID],
+        explanation_xml: str,
+        user_id: str,
+        image_path: Optional[str] = None,
+        artwork_name: Optional[str] = None,
+        image_hash: Optional[str] = None,
+    ) -> None:
+        await self.repository.save_artwork_and_attach_user(
+            artwork_id=artwork_id,
+            explanation_xml=explanation_xml,
+            user_id=user_id,
+            image_path=image_path,
+            artwork_name=artwork_name,
+            image_hash=image_hash,
+        )
+
+    async def get_artwork_explanation_xml(self, artwork_id: str) -> Optional[str]:
+        artwork_id = str(artwork_id)
+        if (explanation_xml := self._explanation_xmls.get(artwork_id)) is not None:
+            return explanation_xml
+
+        explanation_xml = await self.repository.get_artwork_explanation_xml(artwork_id)
+        if explanation_xml is not None:
+            self._explanation_xmls.set(artwork_id, explanation_xml)
+        return explanation_xml
+
+    async def get_artwork_image_path(self, artwork_id: str) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_artwork_image_path(artwork_id)
+
+    async def get_artwork_by_image_hash(self, image_hash: str) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_artwork_by_image_hash(image_hash)
+
+    async def save_subject_expansion(
+        self,
+        artwork_id: str,
+        subject: str,
+        expansion_xml: str,
+        parent_expansion_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        result = await self.repository.save_subject_expansion(
+            artwork_id=artwork_id,
+            subject=subject,
+            expansion_xml=expansion_xml,
+            parent_expansion_id=parent_expansion_id,
+        )
+        # Write through, so the next lookup of this subject finds the new expansion.
+        # Only the ID is kept, the same shape get_cached_subject_expansion returns.
+        cache_key = (artwork_id, subject, parent_expansion_id)
+        self._subject_expansions.set(cache_key, {"expansion_id": result["expansion_id"]})
+        return result
+
+    async def get_subject_expansion(
+        self, expansion_id: str
+    ) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_subject_expansion(expansion_id)
+
+    async def get_subject_expansions(
+        self, artwork_id: str
+    ) -> list[Dict[str, Any]]:
+        return await self.repository.get_subject_expansions(artwork_id)
+
+    async def save_user_artwork(self, user_id: str, artwork_id: Union[str, UUID]) -> None:
+        await self.repository.save_user_artwork(user_id, artwork_id)
+
+    async def get_user_saved_artworks(self, user_id: str) -> list[Dict[str, Any]]:
+        return await self.repository.get_user_saved_artworks(user_id)
+
+    async def get_all_expansions_with_hierarchy(
+        self, artwork_id: str
+    ) -> list[Dict[str, Any]]:
+        return await self.repository.get_all_expansions_with_hierarchy(artwork_id)
+
+    async def get_cached_subject_expansion(
+        self, artwork_id: str, subject: str, parent_expansion_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        cache_key = (artwork_id, subject, parent_expansion_id)
+        if (expansion := self._subject_expansions.get(cache_key)) is not None:
+            return expansion
+
+        expansion = await self.repository.get_cached_subject_expansion(
+            artwork_id=artwork_id,
+            subject=subject,
+            parent_expansion_id=parent_expansion_id,
+        )
+        if expansion is not None:
+            self._subject_expansions.set(cache_key, expansion)
+        return expansion
@@ -0,0 +1,7 @@
+-- One-off migration for databases created before artwork_explanations.image_hash existed.
+-- Run it once, before deploying a version that uses image_hash:
+--   psql "$DATABASE_URL" -f repositories/migrations/001_add_artwork_image_hash.sql
+-- ADD COLUMN takes an ACCESS EXCLUSIVE lock on the table, which is why it is not part
+-- of schema.sql, which runs on every startup.
+
+ALTER TABLE artwork_explanations ADD COLUMN IF NOT EXISTS image_hash VARCHAR(32);
@@ -1,27 +1,69 @@
 -- SQL queries for artwork repository operations
 -- Compatible with PostgreSQL
 
--- name: ensure_user_profile
--- Ensure a user profile exists in the database
-INSERT INTO user_profiles (user_id) VALUES (:user_id::uuid)
-ON CONFLICT (user_id) DO NOTHING;
-
 -- name: save_artwork_explanation
 -- Save an artwork explanation to the database
-INSERT INTO artwork_explanations (artwork_id, explanation_xml, image_path, artwork_name, creator_user_id, created_at)
-VALUES (:artwork_id::uuid, :explanation_xml, :image_path, :artwork_name, :creator_user_id::uuid, :created_at)
+INSERT INTO artwork_explanations (artwork_id, explanation_xml, image_path, artwork_name, creator_user_id, image_hash, created_at)
+VALUES (:artwork_id::uuid, :explanation_xml, :image_path, :artwork_name, :creator_user_id::uuid, :image_hash, :created_at)
 RETURNING artwork_id, explanation_xml, image_path, artwork_name, creator_user_id, created_at;
 
+-- name: save_artwork_explanation_with_user
+-- Save an artwork explanation created by a user, making sure their profile exists in the same statement
+WITH profile AS (
+    INSERT INTO user_profiles (user_id) VALUES (:creator_user_id::uuid)
+    ON CONFLICT (user_id) DO NOTHING
+)
+INSERT INTO artwork_explanations (artwork_id, explanation_xml, image_path, artwork_name, creator_user_id, image_hash, created_at)
+VALUES (:artwork_id::uuid, :explanation_xml, :image_path, :artwork_name, :creator_user_id::uuid, :image_hash, :created_at)
+RETURNING artwork_id, explanation_xml, image_path, artwork_name, creator_user_id, created_at;
+
+-- name: save_artwork_and_attach_user
+-- Save an artwork explanation created by a user and add it to their collection in one statement.
+-- Foreign keys are checked at the end of the statement, so all three rows can be inserted together.
+WITH profile AS (
+    INSERT INTO user_profiles (user_id) VALUES (:user_id::uuid)
+    ON CONFLICT (user_id) DO NOTHING
+), artwork AS (
+    INSERT INTO artwork_explanations (artwork_id, explanation_xml, image_path, artwork_name, creator_user_id, image_hash, created_at)
+    VALUES (:artwork_id::uuid, :explanation_xml, :image_path, :artwork_name, :user_id::uuid, :image_hash, :created_at)
+    RETURNING artwork_id
+)
+INSERT INTO user_saved_artworks (user_id, artwork_id, saved_at)
+SELECT :user_id::uuid, artwork_id, :created_at
+FROM artwork;
+
+-- name: get_artwork_by_image_hash
+-- Retrieve the earliest artwork explained from an identical image.
+-- Concurrent identical uploads can save duplicates, ordering keeps the pick stable.
+SELECT artwork_id
+FROM artwork_explanations
+WHERE image_hash = :image_hash
+ORDER BY created_at, artwork_id
+LIMIT 1;
+
 -- name: get_artwork_explanation
 -- Retrieve an artwork explanation by artwork_id
 SELECT artwork_id, explanation_xml, image_path, artwork_name, creator_user_id, created_at
 FROM artwork_explanations
 WHERE artwork_id = :artwork_id::uuid;
 
+-- name: get_artwork_explanation_xml
+-- Retrieve only the explanation XML of an artwork
+SELECT explanation_xml
+FROM artwork_explanations
+WHERE artwork_id = :artwork_id::uuid;
+
+-- name: get_artwork_image_path
+-- Retrieve only the image path of an artwork, without the explanation XML
+SELECT image_path
+FROM artwork_explanations
+WHERE artwork_id = :artwork_id::uuid;
+
 -- name: save_subject_expansion
--- Save a subject expansion to the database
+-- Save a subject expansion to the database and return the saved row
 INSERT INTO subject_expansions (expansion_id, artwork_id, subject, subject_hash, expansion_xml, parent_expansion_id, created_at)
-VALUES (:expansion_id::uuid, :artwork_id::uuid, :subject::text, md5(:subject::text), :expansion_xml, :parent_expansion_id::uuid, :created_at);
+VALUES (:expansion_id::uuid, :artwork_id::uuid, :subject::text, md5(:subject::text), :expansion_xml, :parent_expansion_id::uuid, :created_at)
+RETURNING expansion_id, artwork_id, subject, subject_hash, expansion_xml, parent_expansion_id, created_at;
 
 -- name: get_subject_expansion
 -- Retrieve a subject expansion by expansion_id
@@ -37,17 +79,22 @@ WHERE artwork_id = :artwork_id::uuid
 ORDER BY created_at;
 
 -- name: get_cached_subject_expansion
--- Retrieve a subject expansion by artwork_id, subject, and parent_expansion_id for caching (PostgreSQL generates hash)
-SELECT expansion_id, artwork_id, subject, subject_hash, expansion_xml, parent_expansion_id, created_at
+-- Retrieve the ID of a subject expansion by artwork_id, subject, and parent_expansion_id for caching (PostgreSQL generates hash)
+SELECT expansion_id
 FROM subject_expansions
 WHERE artwork_id = :artwork_id::uuid 
   AND subject_hash = md5(:subject::text)
   AND (parent_expansion_id = :parent_expansion_id::uuid OR (parent_expansion_id IS NULL AND :parent_expansion_id IS NULL));
 
 -- name: save_user_artwork
--- Save an artwork to a user's collection
+-- Save an artwork to a user's collection, making sure their profile exists in the same statement
+WITH profile AS (
+    INSERT INTO user_profiles (user_id) VALUES (:user_id::uuid)
+    ON CONFLICT (user_id) DO NOTHING
+)
 INSERT INTO user_saved_artworks (user_id, artwork_id, saved_at)
-VALUES (:user_id::uuid, :artwork_id::uuid, :saved_at);
+VALUES (:user_id::uuid, :artwork_id::uuid, :saved_at)
+ON CONFLICT (user_id, artwork_id) DO NOTHING;
 
 -- name: get_user_saved_artworks
 -- Retrieve all artworks saved by a user (metadata only, no XML)
@@ -61,19 +108,20 @@ from artwork_explanations
 
 -- name: get_all_expansions_with_hierarchy
 -- Retrieve all subject expansions for a given artwork using recursive CTE
+-- Only the columns needed to build the tree are selected, the XML bodies are fetched per expansion
 WITH RECURSIVE expansion_tree AS (
     -- Base case: get all root expansions (parent_expansion_id IS NULL)
-    SELECT expansion_id, artwork_id, subject, subject_hash, expansion_xml, parent_expansion_id, created_at, 0 as level
+    SELECT expansion_id, subject, parent_expansion_id, created_at, 0 as level
     FROM subject_expansions
     WHERE artwork_id = :artwork_id::uuid AND parent_expansion_id IS NULL
     
     UNION ALL
     
     -- Recursive case: get all child expansions
-    SELECT se.expansion_id, se.artwork_id, se.subject, se.subject_hash, se.expansion_xml, se.parent_expansion_id, se.created_at, et.level + 1
+    SELECT se.expansion_id, se.subject, se.parent_expansion_id, se.created_at, et.level + 1
     FROM subject_expansions se
     INNER JOIN expansion_tree et ON se.parent_expansion_id = et.expansion_id
 )
-SELECT expansion_id, artwork_id, subject, subject_hash, expansion_xml, parent_expansion_id, created_at
+SELECT expansion_id, subject, parent_expansion_id, created_at
 FROM expansion_tree
 ORDER BY level, created_at;
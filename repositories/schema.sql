@@ -19,6 +19,7 @@ CREATE TABLE IF NOT EXISTS artwork_explanations (
     image_path VARCHAR(500),  -- Path to image in Supabase Storage
     artwork_name VARCHAR(500),  -- Name of the artwork (for name-based explanations)
     creator_user_id UUID references user_profiles(user_id) on delete set null,  -- User who created/uploaded the artwork (nullable for anonymous)
+    image_hash VARCHAR(32),  -- BLAKE2b hash of the processed image, used to reuse explanations of identical uploads
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -53,6 +54,11 @@ CREATE TABLE IF NOT EXISTS user_saved_artworks (
     FOREIGN KEY (artwork_id) REFERENCES artwork_explanations(artwork_id) on delete cascade
 );
 
+-- Index for finding an existing artwork by the hash of its image. It is deliberately not
+-- unique: two identical images uploaded at the same time may both be explained and saved,
+-- which only costs a duplicate artwork, and lookups return the earliest one.
+CREATE INDEX IF NOT EXISTS idx_artwork_explanations_image_hash ON artwork_explanations(image_hash);
+
 -- Index for faster lookups on creator_user_id in artwork_explanations
 CREATE INDEX IF NOT EXISTS idx_artwork_explanations_creator_user_id ON artwork_explanations(creator_user_id);
 
@@ -9,10 +9,32 @@ from PIL import Image
 from google import genai
 from google.genai import types
 from config.prompts import ART_EXPLANATION_PROMPT, WIKILINK_EXPANSION_USER_MESSAGE
-from utils.response_cleaner import clean_xml_response
+from utils.response_cleaner import clean_xml_response_async
 
 logger = logging.getLogger(__name__)
 
+# Prompt-derived request objects are immutable, so build them once per process
+# instead of once per service instance.
+SAFETY_SETTINGS = [
+    types.SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"),
+    types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
+    types.SafetySetting(
+        category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"
+    ),
+]
+GENERATION_CONFIG = types.GenerateContentConfig(
+    system_instruction=ART_EXPLANATION_PROMPT,
+    temperature=0.7,
+    top_p=0.95,
+    top_k=40,
+    max_output_tokens=4096,
+    safety_settings=SAFETY_SETTINGS,
+)
+ANALYZE_ARTWORK_PART = types.Part.from_text(text="Please analyze this artwork.")
+
 
 class GeminiService:
     """Google Gemini service for artwork interpretation."""
@@ -24,30 +46,11 @@ class GeminiService:
         Args:
             api_key: Google API key
         """
+        # Calls go through client.aio, so they don't block the event loop
         self.client = genai.Client(api_key=api_key)
         self.model_name = "models/gemini-2.0-flash-001"
-        self.safety_settings = [
-            types.SafetySetting(
-                category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"
-            ),
-        ]
-        self.generation_config = types.GenerateContentConfig(
-            system_instruction=ART_EXPLANATION_PROMPT,
-            temperature=0.7,
-            top_p=0.95,
-            top_k=40,
-            max_output_tokens=4096,
-            safety_settings=self.safety_settings,
-        )
+        self.safety_settings = SAFETY_SETTINGS
+        self.generation_config = GENERATION_CONFIG
         self.cache_ttl = "3600s"  # 60 minutes in seconds
 
     async def explain_artwork(self, image_data: bytes, cache_name: str):
@@ -64,21 +67,19 @@ class GeminiService:
         Raises:
             Exception: If Gemini API call fails
         """
-        logger.info(f"Starting Gemini API request without caching")
+        logger.info("Starting Gemini API request without caching")
 
         try:
             # Upload image to Gemini Files API
             image_io = io.BytesIO(image_data)
-            image_file = self.client.files.upload(
+            image_file = await self.client.aio.files.upload(
                 file=image_io, config=dict(mime_type="image/jpeg")
             )
-            logger.info(
-                f"Image uploaded: {image_file.name}, size={len(image_data)} bytes"
-            )
+            logger.info("Image uploaded: %s, size=%d bytes", image_file.name, len(image_data))
 
             # Make regular API call without caching
             logger.info("Sending request to Gemini API...")
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=types.Content(
                     role="user",
@@ -86,25 +87,25 @@ class GeminiService:
                         types.Part.from_uri(
                             file_uri=image_file.uri, mime_type=image_file.mime_type
                         ),
-                        types.Part.from_text(text="Please analyze this artwork."),
+                        ANALYZE_ARTWORK_PART,
                     ],
                 ),
                 config=self.generation_config,
             )
 
             logger.info("Received response from Gemini API")
-            logger.info(f"Usage: {response.usage_metadata}")
+            logger.info("Usage: %s", response.usage_metadata)
 
             raw_content = response.text
-            logger.debug(f"Raw response length: {len(raw_content)} characters")
+            logger.debug("Raw response length: %d characters", len(raw_content))
 
             # Clean and return the XML response
-            cleaned_xml = clean_xml_response(raw_content)
+            cleaned_xml = await clean_xml_response_async(raw_content)
             logger.info("XML response cleaned and validated")
             return cleaned_xml
 
         except Exception as e:
-            logger.error(f"Error in Gemini API call: {str(e)}", exc_info=True)
+            logger.error("Error in Gemini API call: %s", e, exc_info=True)
             raise
 
     async def explain_artwork_by_name(self, artwork_name: str, cache_name: str) -> str:
@@ -121,12 +122,12 @@ class GeminiService:
         Raises:
             Exception: If Gemini API call fails
         """
-        logger.info(f"Starting Gemini API request for artwork interpretation by name: {artwork_name}")
+        logger.info("Starting Gemini API request for artwork interpretation by name: %s", artwork_name)
 
         try:
             # Call Gemini API with artwork name
             logger.info("Sending request to Gemini API...")
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=[
                     types.Content(
@@ -141,18 +142,18 @@ class GeminiService:
                 config=self.generation_config,
             )
             logger.info("Received response from Gemini API")
-            logger.info(f"Usage: {response.usage_metadata}")
+            logger.info("Usage: %s", response.usage_metadata)
 
             raw_content = response.text
-            logger.debug(f"Raw response length: {len(raw_content)} characters")
+            logger.debug("Raw response length: %d characters", len(raw_content))
 
             # Clean and return the XML response
-            cleaned_xml = clean_xml_response(raw_content)
+            cleaned_xml = await clean_xml_response_async(raw_content)
             logger.info("XML response cleaned and validated")
             return cleaned_xml
 
         except Exception as e:
-            logger.error(f"Error in Gemini API call for artwork by name: {str(e)}", exc_info=True)
+            logger.error("Error in Gemini API call for artwork by name: %s", e, exc_info=True)
             raise
 
     # For now we ignore the cache and rebuild the context/conversation
@@ -176,18 +177,16 @@ class GeminiService:
         Raises:
             Exception: If Gemini API call fails
         """
-        logger.info(f"Gemini: Expanding subject '{subject}' with text-only context")
+        logger.info("Gemini: Expanding subject '%s' with text-only context", subject)
 
         try:
             # Create a conversation history where the AI already provided the original analysis
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=[
                     types.Content(
                         role="user",
-                        parts=[
-                            types.Part.from_text(text="Please analyze this artwork.")
-                        ],
+                        parts=[ANALYZE_ARTWORK_PART],
                     ),
                     types.Content(
                         role="model",
@@ -207,18 +206,16 @@ class GeminiService:
                 config=self.generation_config,
             )
             logger.info("Received response from Gemini API")
-            logger.info(f"Usage: {response.usage_metadata}")
+            logger.info("Usage: %s", response.usage_metadata)
 
             raw_content = response.text
-            logger.debug(f"Raw response length: {len(raw_content)} characters")
+            logger.debug("Raw response length: %d characters", len(raw_content))
 
             # Clean and return the XML response
-            cleaned_xml = clean_xml_response(raw_content)
+            cleaned_xml = await clean_xml_response_async(raw_content)
             logger.info("XML explanation cleaned and validated")
             return cleaned_xml
 
         except Exception as e:
-            logger.error(
-                f"Error expanding subject with Gemini: {str(e)}", exc_info=True
-            )
+            logger.error("Error expanding subject with Gemini: %s", e, exc_info=True)
             raise
@@ -9,10 +9,13 @@ from typing import Optional
 from PIL import Image
 from openai import AsyncOpenAI
 from config.prompts import ART_EXPLANATION_PROMPT, WIKILINK_EXPANSION_USER_MESSAGE
-from utils.response_cleaner import clean_xml_response
+from utils.response_cleaner import clean_xml_response_async
 
 logger = logging.getLogger(__name__)
 
+# The system prompt message is identical for every request, build it once
+SYSTEM_MESSAGE = {"role": "system", "content": ART_EXPLANATION_PROMPT}
+
 
 class OpenAIService:
     """OpenAI service for artwork interpretation."""
@@ -46,7 +49,7 @@ class OpenAIService:
         Raises:
             Exception: If OpenAI API call fails
         """
-        logger.info(f"Starting OpenAI API request without caching")
+        logger.info("Starting OpenAI API request without caching")
 
         try:
             # Convert image bytes to base64
@@ -57,10 +60,7 @@ class OpenAIService:
             response = await self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": ART_EXPLANATION_PROMPT
-                    },
+                    SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": [
@@ -82,18 +82,18 @@ class OpenAIService:
             )
 
             logger.info("Received response from OpenAI API")
-            logger.info(f"Usage: {response.usage}")
+            logger.info("Usage: %s", response.usage)
 
             raw_content = response.choices[0].message.content
-            logger.debug(f"Raw response length: {len(raw_content)} characters")
+            logger.debug("Raw response length: %d characters", len(raw_content))
 
             # Clean and return the XML response
-            cleaned_xml = clean_xml_response(raw_content)
+            cleaned_xml = await clean_xml_response_async(raw_content)
             logger.info("XML response cleaned and validated")
             return cleaned_xml
 
         except Exception as e:
-            logger.error(f"Error in OpenAI API call: {str(e)}", exc_info=True)
+            logger.error("Error in OpenAI API call: %s", e, exc_info=True)
             raise
 
     async def explain_artwork_by_name(self, artwork_name: str, cache_name: str) -> str:
@@ -110,7 +110,7 @@ class OpenAIService:
         Raises:
             Exception: If OpenAI API call fails
         """
-        logger.info(f"Starting OpenAI API request for artwork interpretation by name: {artwork_name}")
+        logger.info("Starting OpenAI API request for artwork interpretation by name: %s", artwork_name)
 
         try:
             # Call OpenAI API with artwork name
@@ -118,10 +118,7 @@ class OpenAIService:
             response = await self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": ART_EXPLANATION_PROMPT
-                    },
+                    SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": f"Please analyze the artwork '{artwork_name}' according to your instructions."
@@ -131,18 +128,18 @@ class OpenAIService:
                 max_tokens=self.max_tokens
             )
             logger.info("Received response from OpenAI API")
-            logger.info(f"Usage: {response.usage}")
+            logger.info("Usage: %s", response.usage)
 
             raw_content = response.choices[0].message.content
-            logger.debug(f"Raw response length: {len(raw_content)} characters")
+            logger.debug("Raw response length: %d characters", len(raw_content))
 
             # Clean and return the XML response
-            cleaned_xml = clean_xml_response(raw_content)
+            cleaned_xml = await clean_xml_response_async(raw_content)
             logger.info("XML response cleaned and validated")
             return cleaned_xml
 
         except Exception as e:
-            logger.error(f"Error in OpenAI API call for artwork by name: {str(e)}", exc_info=True)
+            logger.error("Error in OpenAI API call for artwork by name: %s", e, exc_info=True)
             raise
 
     async def expand_subject(
@@ -165,17 +162,14 @@ class OpenAIService:
         Raises:
             Exception: If OpenAI API call fails
         """
-        logger.info(f"OpenAI: Expanding subject '{subject}' with text-only context")
+        logger.info("OpenAI: Expanding subject '%s' with text-only context", subject)
 
         try:
             # Create a conversation history where the AI already provided the original analysis
             response = await self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": ART_EXPLANATION_PROMPT
-                    },
+                    SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": "Please analyze this artwork."
@@ -193,18 +187,16 @@ class OpenAIService:
                 max_tokens=self.max_tokens
             )
             logger.info("Received response from OpenAI API")
-            logger.info(f"Usage: {response.usage}")
+            logger.info("Usage: %s", response.usage)
 
             raw_content = response.choices[0].message.content
-            logger.debug(f"Raw response length: {len(raw_content)} characters")
+            logger.debug("Raw response length: %d characters", len(raw_content))
 
             # Clean and return the XML response
-            cleaned_xml = clean_xml_response(raw_content)
+            cleaned_xml = await clean_xml_response_async(raw_content)
             logger.info("XML explanation cleaned and validated")
             return cleaned_xml
 
         except Exception as e:
-            logger.error(
-                f"Error expanding subject with OpenAI: {str(e)}", exc_info=True
-            )
+            logger.error("Error expanding subject with OpenAI: %s", e, exc_info=True)
             raise
@@ -2,12 +2,17 @@
 Artwork-specific image storage service.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Optional, Sequence
 from services.storage.base import StorageService
+from utils.cache import LRUCache, SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of image URLs generated at the same time for one batch
+IMAGE_URL_CONCURRENCY = 20
+
 
 class ArtworkImageStorage:
     """Artwork-specific image storage service that composes a generic storage service."""
@@ -20,6 +25,10 @@ class ArtworkImageStorage:
             storage_service: Generic storage service implementation
         """
         self.storage = storage_service
+        # Image URLs keyed by (image_path, width, height), public URLs never expire
+        self._url_cache = LRUCache(maxsize=4096)
+        # Concurrent misses for the same URL share one call to the storage service
+        self._url_fetches = SingleFlight()
         logger.info("Initialized artwork image storage service")
 
     async def upload_artwork_image(
@@ -42,11 +51,11 @@ class ArtworkImageStorage:
         try:
             # Upload using generic storage service
             result_path = await self.storage.upload(path, image_data, content_type)
-            logger.info(f"Successfully uploaded artwork image: {result_path}")
+            logger.info("Successfully uploaded artwork image: %s", result_path)
             return result_path
 
         except Exception as e:
-            logger.error(f"Error uploading artwork image: {e}")
+            logger.error("Error uploading artwork image: %s", e)
             raise
 
     async def get_image_url(
@@ -60,25 +69,75 @@ class ArtworkImageStorage:
 
         Args:
             image_path: Path to the image in storage
-            expires_in: URL expiration time in seconds (ignored for public URLs)
             width: Optional width for image transformation
             height: Optional height for image transformation
 
         Returns:
             Public URL for accessing the image
         """
+        cache_key = (image_path, width, height)
+        if (public_url := self._url_cache.get(cache_key)) is not None:
+            return public_url
+
+        return await self._url_fetches.do(
+            cache_key, self._generate_image_url, image_path, width, height
+        )
+
+    async def _generate_image_url(
+        self, image_path: str, width: Optional[int], height: Optional[int]
+    ) -> str:
+        """Generate a public URL with the storage service and cache it."""
         try:
             # Generate public URL using generic storage service
             public_url = await self.storage.get_public_url(
                 image_path, width, height
             )
-            logger.info(f"Generated public URL for artwork image: {image_path}")
+            logger.debug("Generated public URL for artwork image: %s", image_path)
+            self._url_cache.set((image_path, width, height), public_url)
             return public_url
 
         except Exception as e:
-            logger.error(f"Error generating public URL for artwork image: {e}")
+            logger.error("Error generating public URL for artwork image: %s", e)
             raise
 
+    async def get_image_urls(self, image_paths: Sequence[Optional[str]]) -> list[Optional[str]]:
+        """
+        Generate public URLs for several artwork images at once.
+
+        Cached URLs are returned directly; the rest are generated concurrently,
+        bounded so a large batch doesn't flood the storage service.
+
+        Args:
+            image_paths: Paths to the images in storage, None entries are allowed
+
+        Returns:
+            Public URLs aligned with image_paths, None where the path was None
+        """
+        image_urls: list[Optional[str]] = [
+            self._url_cache.get((image_path, None, None)) if image_path else None
+            for image_path in image_paths
+        ]
+        missing = [
+            index
+            for index, image_path in enumerate(image_paths)
+            if image_path and image_urls[index] is None
+        ]
+        if not missing:
+            return image_urls
+
+        semaphore = asyncio.Semaphore(IMAGE_URL_CONCURRENCY)
+
+        async def generate_image_url(image_path: str) -> str:
+            async with semaphore:
+                return await self.get_image_url(image_path)
+
+        generated_urls = await asyncio.gather(
+            *(generate_image_url(image_paths[index]) for index in missing)
+        )
+        for index, image_url in zip(missing, generated_urls):
+            image_urls[index] = image_url
+        return image_urls
+
     async def delete_artwork_image(self, image_path: str) -> None:
         """
         Delete an artwork image from storage.
@@ -89,8 +148,8 @@ class ArtworkImageStorage:
         try:
             # Delete using generic storage service
             await self.storage.delete(image_path)
-            logger.info(f"Successfully deleted artwork image: {image_path}")
+            logger.info("Successfully deleted artwork image: %s", image_path)
 
         except Exception as e:
-            logger.error(f"Error deleting artwork image: {e}")
+            logger.error("Error deleting artwork image: %s", e)
             raise
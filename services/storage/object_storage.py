@@ -26,7 +26,7 @@ class ObjectStorageService(StorageService):
         self.client: Client = create_client(url, key)
         self.bucket = bucket
         self.signed_url_expiry = signed_url_expiry
-        logger.info(f"Initialized object storage service with bucket: {bucket}")
+        logger.info("Initialized object storage service with bucket: %s", bucket)
 
     async def upload(self, path: str, data: bytes, content_type: str) -> str:
         """
@@ -46,11 +46,11 @@ class ObjectStorageService(StorageService):
                 path=path, file=data, file_options={"content-type": content_type}
             )
 
-            logger.info(f"Successfully uploaded data to storage: {path}")
+            logger.debug("Successfully uploaded data to storage: %s", path)
             return path
 
         except Exception as e:
-            logger.error(f"Error uploading data to storage: {e}")
+            logger.error("Error uploading data to storage: %s", e)
             raise
 
     async def generate_signed_url(
@@ -109,11 +109,11 @@ class ObjectStorageService(StorageService):
             if not signed_url:
                 raise Exception("No signed URL returned from storage service")
 
-            logger.info(f"Generated signed URL for object: {path}")
+            logger.debug("Generated signed URL for object: %s", path)
             return signed_url
 
         except Exception as e:
-            logger.error(f"Error generating signed URL: {e}")
+            logger.error("Error generating signed URL: %s", e)
             raise
 
     async def get_public_url(
@@ -149,11 +149,11 @@ class ObjectStorageService(StorageService):
                     separator = "&" if "?" in public_url else "?"
                     public_url += f"{separator}{'&'.join(transform_params)}"
 
-            logger.info(f"Generated public URL for object: {path}")
+            logger.debug("Generated public URL for object: %s", path)
             return public_url
 
         except Exception as e:
-            logger.error(f"Error generating public URL: {e}")
+            logger.error("Error generating public URL: %s", e)
             raise
 
     async def delete(self, path: str) -> None:
@@ -173,8 +173,8 @@ class ObjectStorageService(StorageService):
             elif hasattr(result, "error") and result.error:
                 raise Exception(f"Failed to delete object: {result.error}")
 
-            logger.info(f"Successfully deleted object from storage: {path}")
+            logger.info("Successfully deleted object from storage: %s", path)
 
         except Exception as e:
-            logger.error(f"Error deleting object from storage: {e}")
+            logger.error("Error deleting object from storage: %s", e)
             raise
@@ -0,0 +1,68 @@
+"""
+Concurrency limiting of calls to the AI provider.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+from litestar.exceptions import TooManyRequestsException
+from services.base import AIService
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitedAIService:
+    """
+    AI service wrapper that bounds the number of concurrent provider calls.
+
+    Calls beyond the limit wait for a free slot. If none frees up within the queue
+    timeout, the request fails fast with 429 instead of piling more load onto a
+    provider that is already throttling.
+    """
+
+    def __init__(self, ai_service: AIService, max_concurrency: int, queue_timeout: float):
+        """
+        Initialize the limiter.
+
+        Args:
+            ai_service: The AI service whose calls are limited
+            max_concurrency: Maximum number of provider calls in flight
+            queue_timeout: Seconds a call may wait for a free slot
+        """
+        self.ai_service = ai_service
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _call(self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Run an AI service call once a concurrency slot is available."""
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("AI provider concurrency limit reached, rejecting request")
+            raise TooManyRequestsException("AI provider is busy, please retry later")
+
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            self._semaphore.release()
+
+    async def explain_artwork(self, image_data: bytes, cache_name: str) -> str:
+        return await self._call(self.ai_service.explain_artwork, image_data, cache_name)
+
+    async def explain_artwork_by_name(self, artwork_name: str, cache_name: str) -> str:
+        return await self._call(
+            self.ai_service.explain_artwork_by_name, artwork_name, cache_name
+        )
+
+    async def expand_subject(
+        self,
+        artwork_id: str,
+        original_artwork_explanation: str,
+        subject: str,
+    ) -> str:
+        return await self._call(
+            self.ai_service.expand_subject,
+            artwork_id=artwork_id,
+            original_artwork_explanation=original_artwork_explanation,
+            subject=subject,
+        )
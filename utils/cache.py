@@ -0,0 +1,187 @@
+"""
+In-process caching utilities.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Bounded mapping that evicts the least recently used entry when full.
+
+    Not thread-safe; intended for use from the event loop thread only.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Return the cached value for key, marking it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+            The cached value, or default if not found
+        """
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Remove a key from the cache.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+            The removed value, or default if not found
+        """
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache(LRUCache):
+    """
+    LRU cache whose entries also expire a fixed number of seconds after being set.
+
+    Not thread-safe; intended for use from the event loop thread only.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+            ttl: Seconds an entry stays valid after being set
+        """
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Return the cached value for key if it has not expired.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is not cached or has expired
+
+        Returns:
+            The cached value, or default if not found or expired
+        """
+        entry = super().get(key, self._MISSING)
+        if entry is self._MISSING:
+            return default
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value until the TTL elapses.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        super().set(key, (value, time.monotonic() + self.ttl))
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Remove a key from the cache.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+            The removed value, or default if not found
+        """
+        entry = self._data.pop(key, self._MISSING)
+        if entry is self._MISSING:
+            return default
+        return entry[0]
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single in-flight call.
+
+    Callers arriving while a call for their key is running await its result instead
+    of starting another one. Nothing is kept once the call completes.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run fn(*args, **kwargs), or join the call already running for key.
+
+        Args:
+            key: Key identifying the call
+            fn: Coroutine function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn(*args, **kwargs))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so a cancelled caller doesn't cancel the call for everyone else
+        return await asyncio.shield(future)
@@ -2,8 +2,10 @@
 Utility functions for image validation and processing.
 """
 
+import asyncio
 import io
 import logging
+from typing import BinaryIO, Union
 from PIL import Image
 
 logger = logging.getLogger(__name__)
@@ -12,13 +14,37 @@ logger = logging.getLogger(__name__)
 processed_image_content_type = "image/jpeg"
 
 
-async def validate_and_process_image(image_data: bytes, max_size: int = 1000) -> bytes:
+async def validate_and_process_image(
+    image_data: Union[bytes, BinaryIO], max_size: int = 1000
+) -> bytes:
+    """
+    Validate image and resize if too large, in a worker thread.
+
+    Decoding, resizing and encoding are CPU-bound and release the GIL for most of
+    their work, so they run off the event loop and a large upload doesn't stall
+    other requests.
+
+    Args:
+        image_data: Raw image bytes or a binary file-like object
+        max_size: Maximum dimension size (default: 1000px)
+
+    Returns:
+        Processed image bytes in JPEG format
+
+    Raises:
+        ValueError: If image format is invalid
+    """
+    return await asyncio.to_thread(process_image, image_data, max_size)
+
+
+def process_image(image_data: Union[bytes, BinaryIO], max_size: int = 1000) -> bytes:
     """
     Validate image and resize if too large.
 
     Args:
-        image_data: Raw image bytes
-        max_size: Maximum dimension size (default: 2000px)
+        image_data: Raw image bytes or a binary file-like object (e.g. the upload's
+            spooled file), which is decoded directly without an intermediate copy
+        max_size: Maximum dimension size (default: 1000px)
 
     Returns:
         Processed image bytes in JPEG format
@@ -26,17 +52,30 @@ async def validate_and_process_image(image_data: bytes, max_size: int = 1000) ->
     Raises:
         ValueError: If image format is invalid
     """
-    logger.info(f"Starting image validation (received {len(image_data)} bytes)")
+    logger.debug("Starting image validation")
 
     try:
-        img = Image.open(io.BytesIO(image_data))
-        logger.info(
-            f"Image opened successfully: format={img.format}, size={img.size}, mode={img.mode}"
+        if isinstance(image_data, (bytes, bytearray)):
+            image_data = io.BytesIO(image_data)
+        elif image_data.seekable():
+            # The upload may already have been read (e.g. by multipart parsing)
+            image_data.seek(0)
+        else:
+            # Pillow needs random access, buffer non-seekable streams
+            image_data = io.BytesIO(image_data.read())
+        img = Image.open(image_data)
+        logger.debug(
+            "Image opened successfully: format=%s, size=%s, mode=%s", img.format, img.size, img.mode
         )
 
+        # Let JPEG decode at a reduced scale when the image is larger than needed,
+        # so the full-resolution bitmap is never held in memory
+        if img.format == "JPEG" and max(img.size) > max_size:
+            img.draft("RGB", (max_size, max_size))
+
         # Convert to RGB if necessary
         if img.mode not in ("RGB", "RGBA"):
-            logger.info(f"Converting image from {img.mode} to RGB")
+            logger.debug("Converting image from %s to RGB", img.mode)
             img = img.convert("RGB")
 
         # Resize if image is too large (AI providers have size limits)
@@ -45,14 +84,14 @@ async def validate_and_process_image(image_data: bytes, max_size: int = 1000) ->
             ratio = max_size / max(img.size)
             new_size = tuple(int(dim * ratio) for dim in img.size)
             img = img.resize(new_size, Image.Resampling.LANCZOS)
-            logger.info(f"Image resized from {original_size} to {new_size}")
+            logger.debug("Image resized from %s to %s", original_size, new_size)
 
         # Convert back to bytes
         output = io.BytesIO()
         img.save(output, format="JPEG", quality=85)
         processed_bytes = output.getvalue()
-        logger.info(f"Image processed successfully ({len(processed_bytes)} bytes)")
+        logger.debug("Image processed successfully (%d bytes)", len(processed_bytes))
         return processed_bytes
     except Exception as e:
-        logger.error(f"Image processing failed: {str(e)}", exc_info=True)
+        logger.error("Image processing failed: %s", e, exc_info=True)
         raise ValueError(f"Invalid image format: {str(e)}")
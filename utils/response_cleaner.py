@@ -2,9 +2,14 @@
 Utility functions for cleaning and formatting AI responses.
 """
 
+import asyncio
 import re
 from bs4 import BeautifulSoup
 
+# Responses at least this long are cleaned in a worker thread, so parsing them
+# doesn't stall other requests on the event loop
+OFFLOAD_THRESHOLD = 8192
+
 
 def clean_xml_response(xml_content: str) -> str:
     """
@@ -96,3 +101,21 @@ def clean_xml_response(xml_content: str) -> str:
     cleaned = re.sub(r"\n\s*\n", "\n\n", cleaned)  # Remove excessive blank lines
 
     return cleaned.strip()
+
+
+async def clean_xml_response_async(xml_content: str) -> str:
+    """
+    Clean XML response without blocking the event loop on large responses.
+
+    Short responses are cleaned inline, where a thread hand-off would cost more
+    than the parsing itself.
+
+    Args:
+        xml_content: Raw XML content from AI
+
+    Returns:
+        Cleaned XML string with HTML tags removed
+    """
+    if len(xml_content) < OFFLOAD_THRESHOLD:
+        return clean_xml_response(xml_content)
+    return await asyncio.to_thread(clean_xml_response, xml_content)
@@ -2,15 +2,56 @@
 URL resolver utility for generating URLs with both path parameters and query parameters.
 """
 
+import re
 from typing import Dict, Any, Optional
 from urllib.parse import urlencode
 from litestar import Request
+from litestar.exceptions import NoRouteMatchFoundException
+from litestar.datastructures.url import make_absolute_url
+
+# Path parameter type annotations, e.g. the ":str" in "{artwork_id:str}"
+_PATH_PARAM_TYPE = re.compile(r"\{(\w+):[^}]+\}")
+
+# Route path templates keyed by route name, ready for str.format
+_route_templates: Dict[str, str] = {}
+
+
+def url_for(request: Request, route_name: str, **path_params: Any) -> str:
+    """
+    Resolve the absolute URL of a named route, like request.url_for().
+
+    The route's path template is looked up once and cached, so later calls only
+    format it instead of walking the route table.
+
+    Args:
+        request: The Litestar request object
+        route_name: The name of the route to resolve
+        **path_params: Values for the route's path parameters
+
+    Returns:
+        The absolute URL of the route
+
+    Raises:
+        NoRouteMatchFoundException: If no route has the given name
+    """
+    template = _route_templates.get(route_name)
+    if template is None:
+        handler_index = request.app.get_handler_index_by_name(route_name)
+        if handler_index is None:
+            raise NoRouteMatchFoundException(f"Route {route_name} can not be found")
+        template = _PATH_PARAM_TYPE.sub(r"{\1}", handler_index["paths"][0])
+        _route_templates[route_name] = template
+
+    return make_absolute_url(template.format(**path_params), request.base_url)
 
 
 class URLResolver:
     """
     URL resolver that wraps request.url_for() and supports query parameters.
     """
+
+    # Created per request, so skip the instance __dict__
+    __slots__ = ("request",)
     
     def __init__(self, request: Request):
         """
@@ -49,8 +90,8 @@ class URLResolver:
         # Use path_params if provided, otherwise empty dict
         params = path_params or {}
         
-        # Generate the base URL using request.url_for()
-        base_url = self.request.url_for(route_name, **params)
+        # Generate the base URL from the cached route template
+        base_url = url_for(self.request, route_name, **params)
         
         # Append query parameters if provided
         if query_params: